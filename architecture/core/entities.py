@@ -132,8 +132,20 @@ class Percentage:
 # ENTITIES
 # =============================================================================
 
+class SymbolUpperMixin:
+    """Memoriza symbol.upper(); recalcula apenas se o símbolo for reatribuído"""
+    
+    @property
+    def symbol_upper(self) -> str:
+        symbol = self.symbol
+        cached = self.__dict__.get('_symbol_upper')
+        if cached is None or cached[0] is not symbol:
+            cached = (symbol, symbol.upper())
+            self.__dict__['_symbol_upper'] = cached
+        return cached[1]
+
 @dataclass
-class Asset:
+class Asset(SymbolUpperMixin):
     """Entidade que representa um ativo"""
     symbol: str
     name: str
@@ -277,7 +289,7 @@ class AnalysisResult:
         return self.get_max_score() > threshold
 
 @dataclass
-class Order:
+class Order(SymbolUpperMixin):
     """Entidade que representa uma ordem"""
     symbol: str
     side: OrderSide
@@ -326,7 +338,7 @@ class Order:
         return Money(0, "USDT")
 
 @dataclass
-class Position:
+class Position(SymbolUpperMixin):
     """Entidade que representa uma posição"""
     symbol: str
     side: PositionSide
@@ -410,7 +422,7 @@ class Strategy:
         return self.parameters.get(key, default)
 
 @dataclass
-class Trade:
+class Trade(SymbolUpperMixin):
     """Entidade que representa um trade"""
     symbol: str
     side: OrderSide
@@ -249,6 +249,8 @@ class IValidationRule(ABC):
 class IEvent(ABC):
     """Interface para eventos"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_event_type(self) -> str:
         """Retorna tipo do evento"""
@@ -267,6 +269,8 @@ class IEvent(ABC):
 class IEventHandler(ABC):
     """Interface para handlers de eventos"""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def handle(self, event: IEvent) -> None:
         """Processa evento"""
@@ -3,7 +3,7 @@
 Implementações de estratégias de trading usando padrão Strategy
 """
 
-from .base_strategy import BaseStrategy
+from .base_strategy import BaseStrategy, Direction
 from .sniper_strategy import SniperStrategy
 from .scalping_strategy import ScalpingStrategy
 from .swing_strategy import SwingStrategy
@@ -11,6 +11,7 @@ from .strategy_factory import StrategyFactory
 
 __all__ = [
     "BaseStrategy",
+    "Direction",
     "SniperStrategy",
     "ScalpingStrategy", 
     "SwingStrategy",
@@ -4,35 +4,91 @@
 Classe base para todas as estratégias de trading
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Union, ClassVar, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace, asdict, fields
+from enum import IntEnum
+from functools import lru_cache
 
 from ...core.interfaces import IStrategy
 from ...core.entities import AnalysisResult, TechnicalIndicators, MarketData
 
-@dataclass
+class Direction(IntEnum):
+    """Direção dos sinais (comparação inteira em vez de strings)"""
+    NEUTRAL = 0
+    LONG = 1
+    SHORT = -1
+    VOLUME_HIGH = 2
+    VOLUME_LOW = 3
+    VOLUME_NORMAL = 4
+    OI_HIGH = 5
+    OI_LOW = 6
+    OI_NORMAL = 7
+    MOMENTUM_HIGH = 8
+    MOMENTUM_MEDIUM = 9
+    MOMENTUM_LOW = 10
+
+class LazyReasoning:
+    """Justificativa composta, unida com '; ' apenas quando convertida em str"""
+    __slots__ = ('parts', 'suffix')
+    
+    def __init__(self, parts: List[str], suffix: str = ''):
+        self.parts = parts
+        self.suffix = suffix
+    
+    def __str__(self) -> str:
+        return '; '.join(map(str, self.parts)) + self.suffix
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
+    
+    def __add__(self, other: str) -> 'LazyReasoning':
+        return LazyReasoning(self.parts, self.suffix + other)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (str, LazyReasoning)):
+            return str(self) == str(other)
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(str(self))
+    
+    def __bool__(self) -> bool:
+        return bool(self.parts or self.suffix)
+
+@dataclass(slots=True)
 class StrategySignal:
     """Sinal gerado pela estratégia"""
     symbol: str
-    direction: str  # "LONG" ou "SHORT"
+    direction: Direction  # Direction.LONG, SHORT ou NEUTRAL
     strength: float  # 0-10
     confidence: float  # 0-1
     entry_price: Optional[float] = None
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
     leverage: int = 1
-    reasoning: str = ""
-    timestamp: datetime = None
+    reasoning: Union[str, LazyReasoning] = ""
+    timestamp_ns: int = 0  # epoch em nanossegundos (time.time_ns)
     
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        if not self.timestamp_ns:
+            self.timestamp_ns = time.time_ns()
+    
+    @property
+    def direction_str(self) -> str:
+        """Nome da direção ("LONG", "SHORT", ...) para serialização"""
+        return Direction(self.direction).name
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Timestamp do sinal, materializado como datetime apenas na leitura"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StrategyParameters:
-    """Parâmetros da estratégia"""
+    """Parâmetros da estratégia (imutáveis e hasheáveis)"""
     rsi_oversold: float = 30
     rsi_overbought: float = 70
     macd_threshold: float = 0.001
@@ -42,21 +98,86 @@ class StrategyParameters:
     max_leverage: int = 10
     stop_loss_pct: float = 2.0
     take_profit_pct: float = 4.0
+    
+    def with_overrides(self, **overrides: Any) -> 'StrategyParameters':
+        """Retorna nova instância com os valores sobrescritos"""
+        return replace(self, **overrides)
+
+@dataclass(frozen=True, slots=True)
+class DerivedParameters:
+    """Constantes derivadas dos parâmetros, calculadas uma vez por conjunto"""
+    rsi_long_scale: float
+    rsi_short_scale: float
+    macd_scale: float
+    funding_scale: float
+    sl_mult_long: float
+    sl_mult_short: float
+    tp_mult_long: float
+    tp_mult_short: float
+
+@lru_cache(maxsize=32)
+def derive_parameters(parameters: StrategyParameters) -> DerivedParameters:
+    """Calcula recíprocos e multiplicadores para um conjunto de parâmetros"""
+    rsi_short_range = 100 - parameters.rsi_overbought
+    return DerivedParameters(
+        rsi_long_scale=5 / parameters.rsi_oversold if parameters.rsi_oversold else 0.0,
+        rsi_short_scale=5 / rsi_short_range if rsi_short_range else 0.0,
+        macd_scale=3 / parameters.macd_threshold if parameters.macd_threshold else 0.0,
+        funding_scale=2 / parameters.funding_threshold if parameters.funding_threshold else 0.0,
+        sl_mult_long=1 - parameters.stop_loss_pct / 100,
+        sl_mult_short=1 + parameters.stop_loss_pct / 100,
+        tp_mult_long=1 + parameters.take_profit_pct / 100,
+        tp_mult_short=1 - parameters.take_profit_pct / 100
+    )
+
+def combine_strengths(long_strength: float, short_strength: float) -> Tuple[Direction, float, float]:
+    """
+    Redução numérica de combine_signals
+    
+    Returns:
+        Tuple: (direção final, força limitada a 10, confiança 0-1)
+    """
+    if long_strength > short_strength:
+        direction, strength = Direction.LONG, long_strength
+    elif short_strength > long_strength:
+        direction, strength = Direction.SHORT, short_strength
+    else:
+        return Direction.NEUTRAL, 0, 0
+    
+    # Confiança baseada na força total
+    confidence = min(strength / 10, 1.0) if strength > 0 else 0
+    return direction, min(strength, 10), confidence
+
+# Nomes dos campos aceitos por update_parameters
+_PARAMETER_FIELDS = frozenset(f.name for f in fields(StrategyParameters))
+
+# Campos obrigatórios para validate_data
+_REQUIRED_FIELDS = frozenset({'symbol', 'price', 'rsi', 'macd_line', 'macd_signal', 'volume'})
 
 class BaseStrategy(IStrategy, ABC):
     """
     Classe base para todas as estratégias de trading
     """
     
+    # Metadados de classe (lidos pela factory sem instanciar a estratégia)
+    NAME: ClassVar[str] = ""
+    VERSION: ClassVar[str] = ""
+    DESCRIPTION: ClassVar[str] = ""
+    
+    # Tamanho máximo do pool de StrategySignal reutilizáveis
+    _POOL_MAX = 64
+    
     def __init__(self, parameters: Optional[StrategyParameters] = None):
         self.parameters = parameters or StrategyParameters()
+        self._refresh_cached_params()
         self.name = self.get_name()
         self.version = self.get_version()
         self.is_active = True
         self.created_at = datetime.now()
-        self.last_run = None
+        self.last_run_ns: Optional[int] = None
         self.run_count = 0
         self.success_count = 0
+        self._signal_pool: List[StrategySignal] = []
     
     @abstractmethod
     async def analyze(self, data: Dict[str, Any]) -> StrategySignal:
@@ -71,6 +192,11 @@ class BaseStrategy(IStrategy, ABC):
         """
         pass
     
+    @classmethod
+    def default_parameters(cls) -> StrategyParameters:
+        """Parâmetros padrão da estratégia"""
+        return StrategyParameters()
+    
     @abstractmethod
     def get_name(self) -> str:
         """Retorna nome da estratégia"""
@@ -81,15 +207,31 @@ class BaseStrategy(IStrategy, ABC):
         """Retorna versão da estratégia"""
         pass
     
+    @property
+    def last_run(self) -> Optional[datetime]:
+        """Última execução, convertida de last_run_ns sob demanda"""
+        if self.last_run_ns is None:
+            return None
+        return datetime.fromtimestamp(self.last_run_ns / 1e9)
+    
+    def get_strategy_description(self) -> str:
+        """Retorna descrição da estratégia"""
+        return self.DESCRIPTION
+    
     def get_parameters(self) -> Dict[str, Any]:
         """Retorna parâmetros da estratégia"""
-        return self.parameters.__dict__
+        return asdict(self.parameters)
     
     def update_parameters(self, new_parameters: Dict[str, Any]) -> None:
         """Atualiza parâmetros da estratégia"""
-        for key, value in new_parameters.items():
-            if hasattr(self.parameters, key):
-                setattr(self.parameters, key, value)
+        overrides = {key: value for key, value in new_parameters.items() if key in _PARAMETER_FIELDS}
+        if overrides:
+            self.parameters = self.parameters.with_overrides(**overrides)
+            self._refresh_cached_params()
+    
+    def _refresh_cached_params(self) -> None:
+        """Recalcula constantes derivadas dos parâmetros atuais"""
+        self._derived = derive_parameters(self.parameters)
     
     def get_parameter(self, key: str, default: Any = None) -> Any:
         """Obtém parâmetro específico"""
@@ -114,45 +256,33 @@ class BaseStrategy(IStrategy, ABC):
         self.run_count += 1
         if success:
             self.success_count += 1
-        self.last_run = datetime.now()
+        self.last_run_ns = time.time_ns()
     
     def validate_data(self, data: Dict[str, Any]) -> bool:
         """Valida dados de entrada"""
-        required_fields = ['symbol', 'price', 'rsi', 'macd_line', 'macd_signal', 'volume']
-        
-        for field in required_fields:
-            if field not in data:
-                return False
-        
-        # Validações específicas
-        if not 0 <= data.get('rsi', 0) <= 100:
-            return False
-        
-        if data.get('price', 0) <= 0:
-            return False
-        
-        if data.get('volume', 0) < 0:
+        if not _REQUIRED_FIELDS.issubset(data):
             return False
         
-        return True
+        # Validações específicas
+        return 0 <= data['rsi'] <= 100 and data['price'] > 0 and data['volume'] >= 0
     
     def calculate_rsi_signal(self, rsi: float) -> Dict[str, Any]:
         """Calcula sinal baseado no RSI"""
         if rsi < self.parameters.rsi_oversold:
             return {
-                'direction': 'LONG',
-                'strength': (self.parameters.rsi_oversold - rsi) / self.parameters.rsi_oversold * 5,
+                'direction': Direction.LONG,
+                'strength': (self.parameters.rsi_oversold - rsi) * self._derived.rsi_long_scale,
                 'reasoning': f'RSI oversold: {rsi:.1f}'
             }
         elif rsi > self.parameters.rsi_overbought:
             return {
-                'direction': 'SHORT',
-                'strength': (rsi - self.parameters.rsi_overbought) / (100 - self.parameters.rsi_overbought) * 5,
+                'direction': Direction.SHORT,
+                'strength': (rsi - self.parameters.rsi_overbought) * self._derived.rsi_short_scale,
                 'reasoning': f'RSI overbought: {rsi:.1f}'
             }
         else:
             return {
-                'direction': 'NEUTRAL',
+                'direction': Direction.NEUTRAL,
                 'strength': 0,
                 'reasoning': f'RSI neutral: {rsi:.1f}'
             }
@@ -163,21 +293,21 @@ class BaseStrategy(IStrategy, ABC):
         
         if abs(macd_diff) < self.parameters.macd_threshold:
             return {
-                'direction': 'NEUTRAL',
+                'direction': Direction.NEUTRAL,
                 'strength': 0,
                 'reasoning': f'MACD neutral: {macd_diff:.6f}'
             }
         
         if macd_diff > 0:
             return {
-                'direction': 'LONG',
-                'strength': min(abs(macd_diff) / self.parameters.macd_threshold * 3, 5),
+                'direction': Direction.LONG,
+                'strength': min(abs(macd_diff) * self._derived.macd_scale, 5),
                 'reasoning': f'MACD bullish: {macd_diff:.6f}'
             }
         else:
             return {
-                'direction': 'SHORT',
-                'strength': min(abs(macd_diff) / self.parameters.macd_threshold * 3, 5),
+                'direction': Direction.SHORT,
+                'strength': min(abs(macd_diff) * self._derived.macd_scale, 5),
                 'reasoning': f'MACD bearish: {macd_diff:.6f}'
             }
     
@@ -190,19 +320,19 @@ class BaseStrategy(IStrategy, ABC):
         
         if volume_ratio > 1.5:
             return {
-                'direction': 'VOLUME_HIGH',
+                'direction': Direction.VOLUME_HIGH,
                 'strength': min((volume_ratio - 1) * 2, 3),
                 'reasoning': f'High volume: {volume_ratio:.2f}x'
             }
         elif volume_ratio < 0.5:
             return {
-                'direction': 'VOLUME_LOW',
+                'direction': Direction.VOLUME_LOW,
                 'strength': 0,
                 'reasoning': f'Low volume: {volume_ratio:.2f}x'
             }
         else:
             return {
-                'direction': 'VOLUME_NORMAL',
+                'direction': Direction.VOLUME_NORMAL,
                 'strength': 0,
                 'reasoning': f'Normal volume: {volume_ratio:.2f}x'
             }
@@ -212,77 +342,114 @@ class BaseStrategy(IStrategy, ABC):
         if abs(funding_rate) > self.parameters.funding_threshold:
             if funding_rate < 0:
                 return {
-                    'direction': 'LONG',
-                    'strength': min(abs(funding_rate) / self.parameters.funding_threshold * 2, 3),
+                    'direction': Direction.LONG,
+                    'strength': min(abs(funding_rate) * self._derived.funding_scale, 3),
                     'reasoning': f'Negative funding: {funding_rate:.4f}'
                 }
             else:
                 return {
-                    'direction': 'SHORT',
-                    'strength': min(abs(funding_rate) / self.parameters.funding_threshold * 2, 3),
+                    'direction': Direction.SHORT,
+                    'strength': min(abs(funding_rate) * self._derived.funding_scale, 3),
                     'reasoning': f'Positive funding: {funding_rate:.4f}'
                 }
         else:
             return {
-                'direction': 'NEUTRAL',
+                'direction': Direction.NEUTRAL,
                 'strength': 0,
                 'reasoning': f'Neutral funding: {funding_rate:.4f}'
             }
     
-    def combine_signals(self, signals: List[Dict[str, Any]]) -> StrategySignal:
-        """Combina múltiplos sinais em um sinal final"""
+    def combine_signals(self, signals: Sequence[Dict[str, Any]], symbol: Optional[str] = None) -> StrategySignal:
+        """
+        Combina múltiplos sinais em um sinal final
+        
+        Args:
+            signals: Sinais individuais (direction, strength, reasoning)
+            symbol: Símbolo do sinal final; se omitido, usa signals[0]['symbol']
+        """
         long_strength = 0
         short_strength = 0
         reasoning_parts = []
         
         for signal in signals:
-            direction = signal.get('direction', 'NEUTRAL')
+            direction = signal.get('direction', Direction.NEUTRAL)
             strength = signal.get('strength', 0)
             reasoning = signal.get('reasoning', '')
             
-            if direction == 'LONG':
+            if direction == Direction.LONG:
                 long_strength += strength
-            elif direction == 'SHORT':
+            elif direction == Direction.SHORT:
                 short_strength += strength
             
             if reasoning:
                 reasoning_parts.append(reasoning)
         
-        # Determina direção final
-        if long_strength > short_strength:
-            final_direction = 'LONG'
-            final_strength = long_strength
-        elif short_strength > long_strength:
-            final_direction = 'SHORT'
-            final_strength = short_strength
-        else:
-            final_direction = 'NEUTRAL'
-            final_strength = 0
+        final_direction, final_strength, confidence = combine_strengths(long_strength, short_strength)
         
-        # Calcula confiança baseada na força e número de sinais
-        confidence = min(final_strength / 10, 1.0) if final_strength > 0 else 0
+        if symbol is None:
+            symbol = signals[0].get('symbol', '') if signals else ''
         
-        return StrategySignal(
-            symbol=signals[0].get('symbol', '') if signals else '',
-            direction=final_direction,
-            strength=min(final_strength, 10),
-            confidence=confidence,
-            reasoning='; '.join(reasoning_parts)
+        return self._acquire_signal(
+            symbol,
+            final_direction,
+            final_strength,
+            confidence,
+            LazyReasoning(reasoning_parts)
         )
     
-    def calculate_stop_loss(self, entry_price: float, direction: str) -> float:
+    def _acquire_signal(self, symbol: str, direction: Direction, strength: float, confidence: float,
+                        reasoning: Union[str, LazyReasoning] = "", timestamp_ns: int = 0) -> StrategySignal:
+        """Obtém sinal do pool (ou cria um novo) com todos os campos reinicializados"""
+        if not self._signal_pool:
+            return StrategySignal(symbol, direction, strength, confidence,
+                                  reasoning=reasoning, timestamp_ns=timestamp_ns)
+        
+        signal = self._signal_pool.pop()
+        signal.symbol = symbol
+        signal.direction = direction
+        signal.strength = strength
+        signal.confidence = confidence
+        signal.entry_price = None
+        signal.stop_loss = None
+        signal.take_profit = None
+        signal.leverage = 1
+        signal.reasoning = reasoning
+        signal.timestamp_ns = timestamp_ns or time.time_ns()
+        return signal
+    
+    def release_signal(self, signal: StrategySignal) -> None:
+        """
+        Devolve ao pool um sinal que o chamador não vai mais usar
+        
+        Args:
+            signal: Sinal retornado por analyze (não deve ser acessado após a chamada)
+        """
+        if len(self._signal_pool) < self._POOL_MAX:
+            self._signal_pool.append(signal)
+    
+    def reject_signal(self, symbol: str, reasoning: str, timestamp_ns: int = 0) -> StrategySignal:
+        """Retorna sinal NEUTRAL de rejeição reaproveitando o timestamp informado"""
+        return self._acquire_signal(symbol, Direction.NEUTRAL, 0, 0, reasoning, timestamp_ns)
+    
+    def _reject_combined(self, signal: StrategySignal, reasoning: str) -> StrategySignal:
+        """Rejeita o sinal combinado, devolvendo-o ao pool"""
+        rejected = self.reject_signal(signal.symbol, reasoning, signal.timestamp_ns)
+        self.release_signal(signal)
+        return rejected
+    
+    def calculate_stop_loss(self, entry_price: float, direction: Direction) -> float:
         """Calcula stop loss"""
-        if direction == 'LONG':
-            return entry_price * (1 - self.parameters.stop_loss_pct / 100)
+        if direction == Direction.LONG:
+            return entry_price * self._derived.sl_mult_long
         else:
-            return entry_price * (1 + self.parameters.stop_loss_pct / 100)
+            return entry_price * self._derived.sl_mult_short
     
-    def calculate_take_profit(self, entry_price: float, direction: str) -> float:
+    def calculate_take_profit(self, entry_price: float, direction: Direction) -> float:
         """Calcula take profit"""
-        if direction == 'LONG':
-            return entry_price * (1 + self.parameters.take_profit_pct / 100)
+        if direction == Direction.LONG:
+            return entry_price * self._derived.tp_mult_long
         else:
-            return entry_price * (1 - self.parameters.take_profit_pct / 100)
+            return entry_price * self._derived.tp_mult_short
     
     def get_strategy_info(self) -> Dict[str, Any]:
         """Retorna informações da estratégia"""
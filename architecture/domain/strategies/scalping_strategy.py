@@ -4,19 +4,47 @@
 Estratégia de trading de alta frequência para lucros rápidos
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Final, ClassVar
 from datetime import datetime
 
-from .base_strategy import BaseStrategy, StrategySignal, StrategyParameters
+from .base_strategy import BaseStrategy, StrategySignal, StrategyParameters, Direction
+
+_SCALPING_DESCRIPTION: Final[str] = """
+        🎯 SCALPING STRATEGY - ESTRATÉGIA DE ALTA FREQUÊNCIA
+        
+        Esta estratégia foca em identificar oportunidades de trading rápidas,
+        com menor precisão mas maior frequência de sinais.
+        
+        CARACTERÍSTICAS:
+        - RSI menos restritivo (40/60)
+        - MACD mais sensível (0.0001)
+        - Volume mínimo menor (500K+)
+        - Score mínimo menor (5.0+)
+        - Leverage maior (máx 20x)
+        - Stop loss muito apertado (0.5%)
+        - Take profit pequeno (1.0%)
+        
+        FILTROS APLICADOS:
+        ✅ Volume mínimo (menos restritivo)
+        ✅ Score mínimo menor
+        ✅ Confiança mínima (50%+)
+        
+        OBJETIVO: Identificar trades rápidos com lucros pequenos mas frequentes.
+        """
 
 class ScalpingStrategy(BaseStrategy):
     """
     Estratégia Scalping - Foco em lucros rápidos e alta frequência
     """
     
-    def __init__(self, parameters: Optional[StrategyParameters] = None):
-        # Parâmetros específicos do Scalping
-        scalping_params = StrategyParameters(
+    NAME: ClassVar[str] = "Scalping Strategy"
+    VERSION: ClassVar[str] = "1.0.0"
+    DESCRIPTION: ClassVar[str] = _SCALPING_DESCRIPTION
+    
+    @classmethod
+    def default_parameters(cls) -> StrategyParameters:
+        """Parâmetros específicos do Scalping"""
+        return StrategyParameters(
             rsi_oversold=40,  # Menos restritivo
             rsi_overbought=60,  # Menos restritivo
             macd_threshold=0.0001,  # Mais sensível
@@ -27,19 +55,17 @@ class ScalpingStrategy(BaseStrategy):
             stop_loss_pct=0.5,  # Stop loss muito apertado
             take_profit_pct=1.0  # Take profit pequeno
         )
-        
-        if parameters:
-            # Mescla parâmetros customizados
-            for key, value in parameters.__dict__.items():
-                setattr(scalping_params, key, value)
-        
-        super().__init__(scalping_params)
+    
+    def __init__(self, parameters: Optional[StrategyParameters] = None):
+        # Parâmetros customizados substituem todos os campos do preset; como são
+        # imutáveis, a instância recebida é usada diretamente, sem cópia campo a campo
+        super().__init__(parameters or self.default_parameters())
     
     def get_name(self) -> str:
-        return "Scalping Strategy"
+        return self.NAME
     
     def get_version(self) -> str:
-        return "1.0.0"
+        return self.VERSION
     
     async def analyze(self, data: Dict[str, Any]) -> StrategySignal:
         """
@@ -47,13 +73,7 @@ class ScalpingStrategy(BaseStrategy):
         Foca em sinais rápidos com menor precisão mas maior frequência
         """
         if not self.validate_data(data):
-            return StrategySignal(
-                symbol=data.get('symbol', ''),
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning='Dados inválidos'
-            )
+            return self.reject_signal(data.get('symbol', ''), 'Dados inválidos')
         
         symbol = data['symbol']
         price = data['price']
@@ -63,39 +83,35 @@ class ScalpingStrategy(BaseStrategy):
         volume = data['volume']
         funding_rate = data.get('funding_rate', 0)
         
-        signals = []
-        
         # 1. Análise RSI (peso médio)
         rsi_signal = self.calculate_rsi_signal(rsi)
-        rsi_signal['symbol'] = symbol
-        signals.append(rsi_signal)
         
         # 2. Análise MACD (peso alto)
         macd_signal_data = self.calculate_macd_signal(macd_line, macd_signal)
-        macd_signal_data['symbol'] = symbol
-        signals.append(macd_signal_data)
         
         # 3. Análise de Volume (peso baixo)
         volume_signal = self.calculate_volume_signal(volume)
-        volume_signal['symbol'] = symbol
-        signals.append(volume_signal)
         
         # 4. Análise de Funding (peso baixo)
         funding_signal = self.calculate_funding_signal(funding_rate)
-        funding_signal['symbol'] = symbol
-        signals.append(funding_signal)
         
-        # Combina todos os sinais
-        final_signal = self.combine_signals(signals)
+        # Combina todos os sinais (símbolo mantido apenas no sinal final)
+        signals = (rsi_signal, macd_signal_data, volume_signal, funding_signal)
+        final_signal = self.combine_signals(signals, symbol)
         
         # Aplica filtros específicos do Scalping
         final_signal = self._apply_scalping_filters(final_signal, data)
         
         # Calcula níveis de entrada, stop loss e take profit
-        if final_signal.direction != 'NEUTRAL' and final_signal.strength >= self.parameters.min_score:
+        if final_signal.direction != Direction.NEUTRAL and final_signal.strength >= self.parameters.min_score:
+            derived = self._derived
             final_signal.entry_price = price
-            final_signal.stop_loss = self.calculate_stop_loss(price, final_signal.direction)
-            final_signal.take_profit = self.calculate_take_profit(price, final_signal.direction)
+            if final_signal.direction == Direction.LONG:
+                final_signal.stop_loss = price * derived.sl_mult_long
+                final_signal.take_profit = price * derived.tp_mult_long
+            else:
+                final_signal.stop_loss = price * derived.sl_mult_short
+                final_signal.take_profit = price * derived.tp_mult_short
             final_signal.leverage = min(self.parameters.max_leverage, int(final_signal.strength * 2))
         
         return final_signal
@@ -106,61 +122,18 @@ class ScalpingStrategy(BaseStrategy):
         # Filtro 1: Volume mínimo (menos restritivo)
         volume = data.get('volume', 0)
         if volume < self.parameters.volume_threshold:
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning='Volume insuficiente para Scalping'
-            )
+            return self._reject_combined(signal, 'Volume insuficiente para Scalping')
         
         # Filtro 2: Score mínimo (menos restritivo)
         if signal.strength < self.parameters.min_score:
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning=f'Score insuficiente: {signal.strength:.1f} < {self.parameters.min_score}'
-            )
+            return self._reject_combined(signal, f'Score insuficiente: {signal.strength:.1f} < {self.parameters.min_score}')
         
         # Filtro 3: Confiança mínima (menos restritiva)
         if signal.confidence < 0.5:
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning=f'Confiança insuficiente: {signal.confidence:.2f} < 0.5'
-            )
+            return self._reject_combined(signal, f'Confiança insuficiente: {signal.confidence:.2f} < 0.5')
         
         # Se passou em todos os filtros, ajusta confiança
         signal.confidence = min(signal.confidence * 1.05, 1.0)  # Bonus menor
         signal.reasoning += " [SCALPING APPROVED]"
         
         return signal
-    
-    def get_strategy_description(self) -> str:
-        """Retorna descrição da estratégia"""
-        return """
-        🎯 SCALPING STRATEGY - ESTRATÉGIA DE ALTA FREQUÊNCIA
-        
-        Esta estratégia foca em identificar oportunidades de trading rápidas,
-        com menor precisão mas maior frequência de sinais.
-        
-        CARACTERÍSTICAS:
-        - RSI menos restritivo (40/60)
-        - MACD mais sensível (0.0001)
-        - Volume mínimo menor (500K+)
-        - Score mínimo menor (5.0+)
-        - Leverage maior (máx 20x)
-        - Stop loss muito apertado (0.5%)
-        - Take profit pequeno (1.0%)
-        
-        FILTROS APLICADOS:
-        ✅ Volume mínimo (menos restritivo)
-        ✅ Score mínimo menor
-        ✅ Confiança mínima (50%+)
-        
-        OBJETIVO: Identificar trades rápidos com lucros pequenos mas frequentes.
-        """
@@ -4,19 +4,58 @@
 Estratégia de trading de alta precisão para identificação de oportunidades
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Final, ClassVar
 from datetime import datetime
+from functools import lru_cache
 
-from .base_strategy import BaseStrategy, StrategySignal, StrategyParameters
+from .base_strategy import BaseStrategy, StrategySignal, StrategyParameters, Direction
+
+# Granularidade do Open Interest exibido na justificativa
+_OI_BUCKET_SIZE = 100_000
+
+@lru_cache(maxsize=8192)
+def _oi_bucket_reasoning(label: str, bucket: int) -> str:
+    """Justificativa de OI quantizada por bucket (formatação feita uma vez por bucket)"""
+    return f'{label} OI: ~{bucket * _OI_BUCKET_SIZE:,.0f}'
+
+_SNIPER_DESCRIPTION: Final[str] = """
+        🎯 SNIPER STRATEGY - ESTRATÉGIA DE ALTA PRECISÃO
+        
+        Esta estratégia foca em identificar oportunidades de trading com máxima precisão,
+        utilizando múltiplas confirmações técnicas e filtros rigorosos.
+        
+        CARACTERÍSTICAS:
+        - RSI mais restritivo (25/75)
+        - MACD mais sensível (0.0005)
+        - Volume mínimo alto (2M+)
+        - Score mínimo elevado (8.0+)
+        - Leverage conservador (máx 5x)
+        - Stop loss apertado (1.5%)
+        - Take profit moderado (3.0%)
+        
+        FILTROS APLICADOS:
+        ✅ Volume mínimo obrigatório
+        ✅ Score mínimo elevado
+        ✅ Confiança mínima (70%+)
+        ✅ Volatilidade controlada
+        ✅ Spread aceitável
+        
+        OBJETIVO: Identificar trades de alta qualidade com máxima precisão.
+        """
 
 class SniperStrategy(BaseStrategy):
     """
     Estratégia Sniper - Foco em precisão e timing perfeito
     """
     
-    def __init__(self, parameters: Optional[StrategyParameters] = None):
-        # Parâmetros específicos do Sniper
-        sniper_params = StrategyParameters(
+    NAME: ClassVar[str] = "Sniper Strategy"
+    VERSION: ClassVar[str] = "1.0.0"
+    DESCRIPTION: ClassVar[str] = _SNIPER_DESCRIPTION
+    
+    @classmethod
+    def default_parameters(cls) -> StrategyParameters:
+        """Parâmetros específicos do Sniper"""
+        return StrategyParameters(
             rsi_oversold=25,  # Mais restritivo
             rsi_overbought=75,  # Mais restritivo
             macd_threshold=0.0005,  # Mais sensível
@@ -27,19 +66,17 @@ class SniperStrategy(BaseStrategy):
             stop_loss_pct=1.5,  # Stop loss apertado
             take_profit_pct=3.0  # Take profit moderado
         )
-        
-        if parameters:
-            # Mescla parâmetros customizados
-            for key, value in parameters.__dict__.items():
-                setattr(sniper_params, key, value)
-        
-        super().__init__(sniper_params)
+    
+    def __init__(self, parameters: Optional[StrategyParameters] = None):
+        # Parâmetros customizados substituem todos os campos do preset; como são
+        # imutáveis, a instância recebida é usada diretamente, sem cópia campo a campo
+        super().__init__(parameters or self.default_parameters())
     
     def get_name(self) -> str:
-        return "Sniper Strategy"
+        return self.NAME
     
     def get_version(self) -> str:
-        return "1.0.0"
+        return self.VERSION
     
     async def analyze(self, data: Dict[str, Any]) -> StrategySignal:
         """
@@ -47,13 +84,7 @@ class SniperStrategy(BaseStrategy):
         Foca em sinais de alta qualidade com múltiplas confirmações
         """
         if not self.validate_data(data):
-            return StrategySignal(
-                symbol=data.get('symbol', ''),
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning='Dados inválidos'
-            )
+            return self.reject_signal(data.get('symbol', ''), 'Dados inválidos')
         
         symbol = data['symbol']
         price = data['price']
@@ -64,72 +95,68 @@ class SniperStrategy(BaseStrategy):
         funding_rate = data.get('funding_rate', 0)
         open_interest = data.get('open_interest', 0)
         
-        signals = []
-        
         # 1. Análise RSI (peso alto)
         rsi_signal = self.calculate_rsi_signal(rsi)
-        rsi_signal['symbol'] = symbol
-        signals.append(rsi_signal)
         
         # 2. Análise MACD (peso alto)
         macd_signal_data = self.calculate_macd_signal(macd_line, macd_signal)
-        macd_signal_data['symbol'] = symbol
-        signals.append(macd_signal_data)
         
         # 3. Análise de Volume (peso médio)
         volume_signal = self.calculate_volume_signal(volume)
-        volume_signal['symbol'] = symbol
-        signals.append(volume_signal)
         
         # 4. Análise de Funding (peso médio)
         funding_signal = self.calculate_funding_signal(funding_rate)
-        funding_signal['symbol'] = symbol
-        signals.append(funding_signal)
         
         # 5. Análise de Open Interest (peso baixo)
         oi_signal = self._calculate_oi_signal(open_interest)
-        oi_signal['symbol'] = symbol
-        signals.append(oi_signal)
         
         # 6. Análise de Momentum (peso médio)
         momentum_signal = self._calculate_momentum_signal(data)
-        momentum_signal['symbol'] = symbol
-        signals.append(momentum_signal)
+        
+        # Número de sinais é fixo: tupla montada de uma vez, sem appends
+        signals = (rsi_signal, macd_signal_data, volume_signal,
+                   funding_signal, oi_signal, momentum_signal)
         
         # Combina todos os sinais
-        final_signal = self.combine_signals(signals)
+        final_signal = self.combine_signals(signals, symbol)
         
         # Aplica filtros específicos do Sniper
         final_signal = self._apply_sniper_filters(final_signal, data)
         
         # Calcula níveis de entrada, stop loss e take profit
-        if final_signal.direction != 'NEUTRAL' and final_signal.strength >= self.parameters.min_score:
+        if final_signal.direction != Direction.NEUTRAL and final_signal.strength >= self.parameters.min_score:
+            derived = self._derived
             final_signal.entry_price = price
-            final_signal.stop_loss = self.calculate_stop_loss(price, final_signal.direction)
-            final_signal.take_profit = self.calculate_take_profit(price, final_signal.direction)
+            if final_signal.direction == Direction.LONG:
+                final_signal.stop_loss = price * derived.sl_mult_long
+                final_signal.take_profit = price * derived.tp_mult_long
+            else:
+                final_signal.stop_loss = price * derived.sl_mult_short
+                final_signal.take_profit = price * derived.tp_mult_short
             final_signal.leverage = min(self.parameters.max_leverage, int(final_signal.strength))
         
         return final_signal
     
     def _calculate_oi_signal(self, open_interest: float) -> Dict[str, Any]:
         """Calcula sinal baseado no Open Interest"""
+        bucket = int(open_interest // _OI_BUCKET_SIZE)
         if open_interest > 5000000:  # OI alto
             return {
-                'direction': 'OI_HIGH',
+                'direction': Direction.OI_HIGH,
                 'strength': 1,
-                'reasoning': f'High OI: {open_interest:,.0f}'
+                'reasoning': _oi_bucket_reasoning('High', bucket)
             }
         elif open_interest < 1000000:  # OI baixo
             return {
-                'direction': 'OI_LOW',
+                'direction': Direction.OI_LOW,
                 'strength': 0,
-                'reasoning': f'Low OI: {open_interest:,.0f}'
+                'reasoning': _oi_bucket_reasoning('Low', bucket)
             }
         else:
             return {
-                'direction': 'OI_NORMAL',
+                'direction': Direction.OI_NORMAL,
                 'strength': 0.5,
-                'reasoning': f'Normal OI: {open_interest:,.0f}'
+                'reasoning': _oi_bucket_reasoning('Normal', bucket)
             }
     
     def _calculate_momentum_signal(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -156,7 +183,7 @@ class SniperStrategy(BaseStrategy):
             reasoning_parts.append(f'Volume change: {volume_change:.1f}%')
         
         if momentum_score > 0:
-            direction = 'MOMENTUM_HIGH' if momentum_score >= 2 else 'MOMENTUM_MEDIUM'
+            direction = Direction.MOMENTUM_HIGH if momentum_score >= 2 else Direction.MOMENTUM_MEDIUM
             return {
                 'direction': direction,
                 'strength': min(momentum_score, 3),
@@ -164,7 +191,7 @@ class SniperStrategy(BaseStrategy):
             }
         else:
             return {
-                'direction': 'MOMENTUM_LOW',
+                'direction': Direction.MOMENTUM_LOW,
                 'strength': 0,
                 'reasoning': 'Low momentum'
             }
@@ -175,55 +202,25 @@ class SniperStrategy(BaseStrategy):
         # Filtro 1: Volume mínimo obrigatório
         volume = data.get('volume', 0)
         if volume < self.parameters.volume_threshold:
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning='Volume insuficiente para Sniper'
-            )
+            return self._reject_combined(signal, 'Volume insuficiente para Sniper')
         
         # Filtro 2: Score mínimo obrigatório
         if signal.strength < self.parameters.min_score:
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning=f'Score insuficiente: {signal.strength:.1f} < {self.parameters.min_score}'
-            )
+            return self._reject_combined(signal, f'Score insuficiente: {signal.strength:.1f} < {self.parameters.min_score}')
         
         # Filtro 3: Confiança mínima
         if signal.confidence < 0.7:
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning=f'Confiança insuficiente: {signal.confidence:.2f} < 0.7'
-            )
+            return self._reject_combined(signal, f'Confiança insuficiente: {signal.confidence:.2f} < 0.7')
         
         # Filtro 4: Verificação de volatilidade
         volatility = data.get('volatility_24h', 0)
         if volatility > 20:  # Volatilidade muito alta
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning=f'Volatilidade muito alta: {volatility:.1f}%'
-            )
+            return self._reject_combined(signal, f'Volatilidade muito alta: {volatility:.1f}%')
         
         # Filtro 5: Verificação de spread
         spread = data.get('spread', 0)
         if spread > 0.1:  # Spread muito alto
-            return StrategySignal(
-                symbol=signal.symbol,
-                direction='NEUTRAL',
-                strength=0,
-                confidence=0,
-                reasoning=f'Spread muito alto: {spread:.3f}'
-            )
+            return self._reject_combined(signal, f'Spread muito alto: {spread:.3f}')
         
         # Se passou em todos os filtros, ajusta confiança
         signal.confidence = min(signal.confidence * 1.1, 1.0)  # Bonus de confiança
@@ -231,33 +228,6 @@ class SniperStrategy(BaseStrategy):
         
         return signal
     
-    def get_strategy_description(self) -> str:
-        """Retorna descrição da estratégia"""
-        return """
-        🎯 SNIPER STRATEGY - ESTRATÉGIA DE ALTA PRECISÃO
-        
-        Esta estratégia foca em identificar oportunidades de trading com máxima precisão,
-        utilizando múltiplas confirmações técnicas e filtros rigorosos.
-        
-        CARACTERÍSTICAS:
-        - RSI mais restritivo (25/75)
-        - MACD mais sensível (0.0005)
-        - Volume mínimo alto (2M+)
-        - Score mínimo elevado (8.0+)
-        - Leverage conservador (máx 5x)
-        - Stop loss apertado (1.5%)
-        - Take profit moderado (3.0%)
-        
-        FILTROS APLICADOS:
-        ✅ Volume mínimo obrigatório
-        ✅ Score mínimo elevado
-        ✅ Confiança mínima (70%+)
-        ✅ Volatilidade controlada
-        ✅ Spread aceitável
-        
-        OBJETIVO: Identificar trades de alta qualidade com máxima precisão.
-        """
-    
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Retorna métricas de performance da estratégia"""
         return {
@@ -268,6 +238,5 @@ class SniperStrategy(BaseStrategy):
             'success_rate': self.get_success_rate(),
             'is_active': self.is_active,
             'last_run': self.last_run.isoformat() if self.last_run else None,
-            'parameters': self.get_parameters(),
-            'description': self.get_strategy_description()
+            'parameters': self.get_parameters()
         }
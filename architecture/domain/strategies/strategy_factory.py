@@ -4,8 +4,12 @@
 Factory para criação de estratégias usando padrão Factory
 """
 
-from typing import Dict, List, Optional, Any, Type
+import logging
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Type, Tuple
 from datetime import datetime
+from dataclasses import asdict
 
 from ...core.interfaces import IStrategyFactory, IStrategy
 from .base_strategy import BaseStrategy, StrategyParameters
@@ -13,6 +17,42 @@ from .sniper_strategy import SniperStrategy
 from .scalping_strategy import ScalpingStrategy
 from .swing_strategy import SwingStrategy
 
+# Configurações recomendadas por nível de risco (somente leitura)
+_RISK_CONFIGS = MappingProxyType({
+    'low': MappingProxyType({
+        'rsi_oversold': 20,
+        'rsi_overbought': 80,
+        'min_score': 8.5,
+        'max_leverage': 3,
+        'stop_loss_pct': 1.0,
+        'take_profit_pct': 2.0
+    }),
+    'medium': MappingProxyType({
+        'rsi_oversold': 30,
+        'rsi_overbought': 70,
+        'min_score': 7.0,
+        'max_leverage': 5,
+        'stop_loss_pct': 2.0,
+        'take_profit_pct': 4.0
+    }),
+    'high': MappingProxyType({
+        'rsi_oversold': 35,
+        'rsi_overbought': 65,
+        'min_score': 6.0,
+        'max_leverage': 10,
+        'stop_loss_pct': 3.0,
+        'take_profit_pct': 6.0
+    })
+})
+
+# Faixas válidas de parâmetros: (chave, mínimo, máximo, mensagem de erro)
+_PARAM_RANGES = (
+    ('rsi_oversold', 0, 50, "RSI oversold must be between 0 and 50"),
+    ('rsi_overbought', 50, 100, "RSI overbought must be between 50 and 100"),
+    ('min_score', 0, 10, "Min score must be between 0 and 10"),
+    ('max_leverage', 1, 100, "Max leverage must be between 1 and 100"),
+)
+
 class StrategyFactory(IStrategyFactory):
     """
     Factory para criação de estratégias de trading
@@ -24,7 +64,12 @@ class StrategyFactory(IStrategyFactory):
             'scalping': ScalpingStrategy,
             'swing': SwingStrategy
         }
-        self._instances: Dict[str, BaseStrategy] = {}
+        self._strategy_names: Tuple[str, ...] = tuple(self._strategies)
+        self._info_cache: Dict[Type[BaseStrategy], Dict[str, Any]] = {}
+        self._comparison_cache: Optional[Dict[str, Any]] = None
+        self._info_lock = threading.Lock()
+        self._created_at_iso = datetime.now().isoformat()
+        self._logger = logging.getLogger(__name__)
     
     def create_strategy(self, strategy_type: str, parameters: Optional[Dict[str, Any]] = None) -> IStrategy:
         """
@@ -45,24 +90,21 @@ class StrategyFactory(IStrategyFactory):
         if parameters:
             strategy_params = StrategyParameters(**parameters)
         
-        # Cria instância da estratégia
+        # Cria instância da estratégia (não é retida pela factory)
         strategy_class = self._strategies[strategy_type]
-        instance = strategy_class(strategy_params)
-        
-        # Armazena instância para reutilização
-        instance_key = f"{strategy_type}_{id(instance)}"
-        self._instances[instance_key] = instance
-        
-        return instance
+        return strategy_class(strategy_params)
     
     def get_available_strategies(self) -> List[str]:
         """Retorna estratégias disponíveis"""
-        return list(self._strategies.keys())
+        return list(self._strategy_names)
     
     def register_strategy(self, name: str, strategy_class: Type[BaseStrategy]) -> None:
         """
         Registra nova estratégia
         
+        Classes que declaram NAME e VERSION têm get_strategy_info resolvido sem
+        instanciar; as demais são instanciadas uma vez para ler os metadados.
+        
         Args:
             name: Nome da estratégia
             strategy_class: Classe da estratégia
@@ -70,7 +112,13 @@ class StrategyFactory(IStrategyFactory):
         if not issubclass(strategy_class, BaseStrategy):
             raise ValueError("Strategy class must inherit from BaseStrategy")
         
-        self._strategies[name] = strategy_class
+        with self._info_lock:
+            old_class = self._strategies.get(name)
+            if old_class is not None:
+                self._info_cache.pop(old_class, None)
+            self._strategies[name] = strategy_class
+            self._strategy_names = tuple(self._strategies)
+            self._comparison_cache = None
     
     def unregister_strategy(self, name: str) -> bool:
         """
@@ -82,9 +130,12 @@ class StrategyFactory(IStrategyFactory):
         Returns:
             bool: True se removida com sucesso
         """
-        if name in self._strategies:
-            del self._strategies[name]
-            return True
+        with self._info_lock:
+            if name in self._strategies:
+                self._info_cache.pop(self._strategies.pop(name), None)
+                self._strategy_names = tuple(self._strategies)
+                self._comparison_cache = None
+                return True
         return False
     
     def get_strategy_info(self, strategy_type: str) -> Dict[str, Any]:
@@ -102,16 +153,32 @@ class StrategyFactory(IStrategyFactory):
         
         strategy_class = self._strategies[strategy_type]
         
-        # Cria instância temporária para obter informações
-        temp_instance = strategy_class()
+        info = self._info_cache.get(strategy_class)
+        if info is None:
+            if strategy_class.NAME and strategy_class.VERSION:
+                # Metadados declarados na classe: dispensa instância temporária
+                info = {
+                    'name': strategy_class.NAME,
+                    'version': strategy_class.VERSION,
+                    'description': strategy_class.DESCRIPTION,
+                    'parameters': asdict(strategy_class.default_parameters()),
+                    'class_name': strategy_class.__name__
+                }
+            else:
+                # Estratégia registrada sem NAME/VERSION (só get_name/get_version):
+                # cria instância temporária para obter informações
+                temp_instance = strategy_class()
+                info = {
+                    'name': temp_instance.get_name(),
+                    'version': temp_instance.get_version(),
+                    'description': temp_instance.get_strategy_description(),
+                    'parameters': temp_instance.get_parameters(),
+                    'class_name': strategy_class.__name__
+                }
+            with self._info_lock:
+                self._info_cache[strategy_class] = info
         
-        return {
-            'name': temp_instance.get_name(),
-            'version': temp_instance.get_version(),
-            'description': getattr(temp_instance, 'get_strategy_description', lambda: '')(),
-            'parameters': temp_instance.get_parameters(),
-            'class_name': strategy_class.__name__
-        }
+        return dict(info, parameters=dict(info['parameters']))
     
     def create_strategy_with_config(self, config: Dict[str, Any]) -> IStrategy:
         """
@@ -158,12 +225,16 @@ class StrategyFactory(IStrategyFactory):
         strategies = []
         
         for config in configs:
-            try:
-                strategy = self.create_strategy_with_config(config)
-                strategies.append(strategy)
-            except Exception as e:
-                print(f"Error creating strategy with config {config}: {e}")
+            # Configurações inválidas são descartadas sem passar por exceção
+            errors = self.validate_strategy_config(config)
+            if errors:
+                self._logger.warning("Skipping invalid strategy config %r: %s", config, '; '.join(errors))
                 continue
+            
+            try:
+                strategies.append(self.create_strategy_with_config(config))
+            except Exception:
+                self._logger.exception("Error creating strategy with config %r", config)
         
         return strategies
     
@@ -174,9 +245,28 @@ class StrategyFactory(IStrategyFactory):
         Returns:
             Dict: Comparação das estratégias
         """
+        comparison = self._comparison_cache
+        if comparison is None:
+            names = self._strategy_names
+            comparison = self._build_comparison(names)
+            with self._info_lock:
+                # Só guarda se não houve registro durante a montagem
+                if names is self._strategy_names:
+                    self._comparison_cache = comparison
+        
+        return {
+            strategy_type: (
+                dict(entry, parameters=dict(entry['parameters']))
+                if 'parameters' in entry else dict(entry)
+            )
+            for strategy_type, entry in comparison.items()
+        }
+    
+    def _build_comparison(self, names: Tuple[str, ...]) -> Dict[str, Any]:
+        """Monta comparação das estratégias informadas"""
         comparison = {}
         
-        for strategy_type in self._strategies:
+        for strategy_type in names:
             try:
                 info = self.get_strategy_info(strategy_type)
                 comparison[strategy_type] = {
@@ -208,26 +298,12 @@ class StrategyFactory(IStrategyFactory):
         elif config['type'] not in self._strategies:
             errors.append(f"Unknown strategy type: {config['type']}")
         
-        # Valida parâmetros
-        if 'parameters' in config:
-            parameters = config['parameters']
-            
-            # Valida parâmetros específicos
-            if 'rsi_oversold' in parameters:
-                if not 0 <= parameters['rsi_oversold'] <= 50:
-                    errors.append("RSI oversold must be between 0 and 50")
-            
-            if 'rsi_overbought' in parameters:
-                if not 50 <= parameters['rsi_overbought'] <= 100:
-                    errors.append("RSI overbought must be between 50 and 100")
-            
-            if 'min_score' in parameters:
-                if not 0 <= parameters['min_score'] <= 10:
-                    errors.append("Min score must be between 0 and 10")
-            
-            if 'max_leverage' in parameters:
-                if not 1 <= parameters['max_leverage'] <= 100:
-                    errors.append("Max leverage must be between 1 and 100")
+        # Valida parâmetros a partir da tabela de faixas
+        parameters = config.get('parameters') or {}
+        for key, low, high, message in _PARAM_RANGES:
+            value = parameters.get(key)
+            if value is not None and not low <= value <= high:
+                errors.append(message)
         
         return errors
     
@@ -245,40 +321,12 @@ class StrategyFactory(IStrategyFactory):
         if strategy_type not in self._strategies:
             raise ValueError(f"Unknown strategy type: {strategy_type}")
         
-        # Configurações baseadas no nível de risco
-        risk_configs = {
-            'low': {
-                'rsi_oversold': 20,
-                'rsi_overbought': 80,
-                'min_score': 8.5,
-                'max_leverage': 3,
-                'stop_loss_pct': 1.0,
-                'take_profit_pct': 2.0
-            },
-            'medium': {
-                'rsi_oversold': 30,
-                'rsi_overbought': 70,
-                'min_score': 7.0,
-                'max_leverage': 5,
-                'stop_loss_pct': 2.0,
-                'take_profit_pct': 4.0
-            },
-            'high': {
-                'rsi_oversold': 35,
-                'rsi_overbought': 65,
-                'min_score': 6.0,
-                'max_leverage': 10,
-                'stop_loss_pct': 3.0,
-                'take_profit_pct': 6.0
-            }
-        }
-        
-        if risk_level not in risk_configs:
+        if risk_level not in _RISK_CONFIGS:
             risk_level = 'medium'
         
         return {
             'type': strategy_type,
-            'parameters': risk_configs[risk_level],
+            'parameters': dict(_RISK_CONFIGS[risk_level]),
             'risk_level': risk_level,
             'created_at': datetime.now().isoformat()
         }
@@ -287,7 +335,6 @@ class StrategyFactory(IStrategyFactory):
         """Retorna estatísticas da factory"""
         return {
             'registered_strategies': len(self._strategies),
-            'available_strategies': list(self._strategies.keys()),
-            'active_instances': len(self._instances),
-            'factory_created_at': datetime.now().isoformat()
+            'available_strategies': list(self._strategy_names),
+            'factory_created_at': self._created_at_iso
         }
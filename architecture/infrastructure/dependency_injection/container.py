@@ -21,27 +21,33 @@ class DependencyContainer(IDependencyContainer):
         self._transients: Dict[Type, Type] = {}
         self._instances: Dict[Type, Any] = {}
         self._factories: Dict[Type, Callable] = {}
+        # Tipos não registrados cuja resolução falhou; limpo a cada novo registro
+        self._unresolvable: set = set()
         self._lock = threading.RLock()
     
     def register_singleton(self, interface: Type, implementation: Type) -> None:
         """Registra implementação como singleton"""
         with self._lock:
             self._singletons[interface] = implementation
+            self._unresolvable.clear()
     
     def register_transient(self, interface: Type, implementation: Type) -> None:
         """Registra implementação como transient"""
         with self._lock:
             self._transients[interface] = implementation
+            self._unresolvable.clear()
     
     def register_instance(self, interface: Type, instance: Any) -> None:
         """Registra instância específica"""
         with self._lock:
             self._instances[interface] = instance
+            self._unresolvable.clear()
     
     def register_factory(self, interface: Type, factory: Callable) -> None:
         """Registra factory para criação de instâncias"""
         with self._lock:
             self._factories[interface] = factory
+            self._unresolvable.clear()
     
     def resolve(self, interface: Type) -> Any:
         """Resolve dependência"""
@@ -75,6 +81,21 @@ class DependencyContainer(IDependencyContainer):
             except Exception as e:
                 raise ValueError(f"Cannot resolve dependency for {interface}: {e}")
     
+    def try_resolve(self, interface: Type, default: Any = None) -> Any:
+        """Resolve dependência, retornando default em vez de lançar ValueError"""
+        with self._lock:
+            if interface in self._unresolvable:
+                return default
+            try:
+                return self.resolve(interface)
+            except ValueError:
+                # Só memoriza tipos que não estão registrados em lugar nenhum;
+                # falhas de factory/construtor podem ser transitórias
+                if not (interface in self._instances or interface in self._singletons or
+                        interface in self._transients or interface in self._factories):
+                    self._unresolvable.add(interface)
+                return default
+    
     def _create_instance(self, implementation: Type) -> Any:
         """Cria instância da implementação"""
         try:
@@ -132,6 +153,7 @@ class DependencyContainer(IDependencyContainer):
             self._transients.clear()
             self._instances.clear()
             self._factories.clear()
+            self._unresolvable.clear()
     
     def get_registered_types(self) -> Dict[str, list]:
         """Retorna tipos registrados"""
@@ -181,6 +203,8 @@ class DependencyScope:
 # Instância global do container
 _container: Optional[DependencyContainer] = None
 _container_lock = threading.RLock()
+# Incrementada sempre que o container global é trocado ou limpo
+_container_epoch = 0
 
 def get_container() -> DependencyContainer:
     """Obtém instância global do container"""
@@ -192,38 +216,61 @@ def get_container() -> DependencyContainer:
 
 def set_container(container: DependencyContainer) -> None:
     """Define instância global do container"""
-    global _container
+    global _container, _container_epoch
     with _container_lock:
         _container = container
+        _container_epoch += 1
 
 def clear_container() -> None:
     """Limpa instância global do container"""
-    global _container
+    global _container, _container_epoch
     with _container_lock:
         _container = None
+        _container_epoch += 1
+
+def get_container_epoch() -> int:
+    """Retorna a época atual do container global"""
+    return _container_epoch
+
+def container_getter() -> Callable[[], DependencyContainer]:
+    """
+    Cria função que retorna o container global, chamando get_container()
+    apenas quando a época muda (set_container/clear_container)
+    """
+    cached: list = [None, -1]
+    
+    def current() -> DependencyContainer:
+        epoch = _container_epoch
+        if cached[1] != epoch:
+            cached[0] = get_container()
+            cached[1] = epoch
+        return cached[0]
+    
+    return current
 
 # Decorator para injeção automática
 def inject_dependencies(func: Callable) -> Callable:
     """Decorator para injeção automática de dependências"""
+    # Obtém assinatura da função uma única vez
+    annotated_params = tuple(
+        (name, param.annotation, param.default)
+        for name, param in inspect.signature(func).parameters.items()
+        if param.annotation is not inspect.Parameter.empty
+    )
+    
+    current_container = container_getter()
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Obtém assinatura da função
-        signature = inspect.signature(func)
-        parameters = signature.parameters
-        
         # Resolve dependências
-        container = get_container()
+        container = current_container()
         resolved_kwargs = kwargs.copy()
         
-        for param_name, param in parameters.items():
+        for param_name, param_type, default in annotated_params:
             if param_name not in resolved_kwargs and param_name not in args:
-                param_type = param.annotation
-                if param_type != inspect.Parameter.empty:
-                    try:
-                        resolved_kwargs[param_name] = container.resolve(param_type)
-                    except ValueError:
-                        if param.default != inspect.Parameter.empty:
-                            resolved_kwargs[param_name] = param.default
+                resolved = container.try_resolve(param_type, default)
+                if resolved is not inspect.Parameter.empty:
+                    resolved_kwargs[param_name] = resolved
         
         return func(*args, **resolved_kwargs)
     
@@ -238,14 +285,17 @@ def injectable(cls: Type) -> Type:
 # Decorator para métodos com injeção
 def inject(*dependencies: Type) -> Callable:
     """Decorator para injeção de dependências específicas"""
+    plan = tuple((dep_type.__name__.lower(), dep_type) for dep_type in dependencies)
+    
     def decorator(func: Callable) -> Callable:
+        current_container = container_getter()
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            container = get_container()
+            container = current_container()
             resolved_kwargs = kwargs.copy()
             
-            for dep_type in dependencies:
-                dep_name = dep_type.__name__.lower()
+            for dep_name, dep_type in plan:
                 if dep_name not in resolved_kwargs:
                     resolved_kwargs[dep_name] = container.resolve(dep_type)
             
@@ -4,11 +4,40 @@
 Decorators para facilitar injeção de dependências
 """
 
+import os
+import sys
 import inspect
 import functools
-from typing import Type, Callable, Any, Dict, List
+from weakref import WeakKeyDictionary
+from typing import Type, Callable, Any, Dict, List, Tuple
 
-from .container import get_container
+from .container import get_container, container_getter
+
+# Sentinela para dependências que não puderam ser resolvidas
+_MISSING = object()
+
+# Nomes de parâmetro (tipo em minúsculas) internados por tipo
+_NAME_CACHE: 'WeakKeyDictionary[type, str]' = WeakKeyDictionary()
+
+def _dep_name(dep_type: Type) -> str:
+    """Retorna nome internado do parâmetro para o tipo de dependência"""
+    name = _NAME_CACHE.get(dep_type)
+    if name is None:
+        name = sys.intern(dep_type.__name__.lower())
+        _NAME_CACHE[dep_type] = name
+    return name
+
+def _annotated_parameters(func: Callable) -> Tuple[Tuple[str, Any, Any], ...]:
+    """Retorna (nome, tipo, default) dos parâmetros anotados de func"""
+    return tuple(
+        (name, param.annotation, param.default)
+        for name, param in inspect.signature(func).parameters.items()
+        if param.annotation is not inspect.Parameter.empty
+    )
+
+def _resolution_plan(dependencies: Tuple[Type, ...]) -> Tuple[Tuple[str, Type], ...]:
+    """Retorna (nome do parâmetro, tipo) para cada dependência"""
+    return tuple((_dep_name(dep_type), dep_type) for dep_type in dependencies)
 
 def injectable(cls: Type) -> Type:
     """
@@ -32,21 +61,24 @@ def inject(*dependencies: Type) -> Callable:
         def my_function(repository: IRepository, logger: ILogger):
             pass
     """
+    # Plano de resolução (nome do parâmetro, tipo) montado uma única vez
+    plan = _resolution_plan(dependencies)
+    
     def decorator(func: Callable) -> Callable:
+        current_container = container_getter()
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            container = get_container()
+            container = current_container()
             resolved_kwargs = kwargs.copy()
             
             # Resolve dependências especificadas
-            for dep_type in dependencies:
-                dep_name = dep_type.__name__.lower()
+            for dep_name, dep_type in plan:
                 if dep_name not in resolved_kwargs:
-                    try:
-                        resolved_kwargs[dep_name] = container.resolve(dep_type)
-                    except ValueError:
-                        # Se não conseguir resolver, continua sem a dependência
-                        pass
+                    # Se não conseguir resolver, continua sem a dependência
+                    resolved = container.try_resolve(dep_type, _MISSING)
+                    if resolved is not _MISSING:
+                        resolved_kwargs[dep_name] = resolved
             
             return func(*args, **resolved_kwargs)
         
@@ -62,23 +94,21 @@ def auto_inject(func: Callable) -> Callable:
         def my_function(repository: IRepository, logger: ILogger):
             pass
     """
+    # Assinatura calculada uma única vez, na decoração
+    annotated_params = _annotated_parameters(func)
+    current_container = container_getter()
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        container = get_container()
-        signature = inspect.signature(func)
-        parameters = signature.parameters
-        
+        container = current_container()
         resolved_kwargs = kwargs.copy()
         
-        for param_name, param in parameters.items():
+        for param_name, param_type, default in annotated_params:
             if param_name not in resolved_kwargs and param_name not in args:
-                param_type = param.annotation
-                if param_type != inspect.Parameter.empty:
-                    try:
-                        resolved_kwargs[param_name] = container.resolve(param_type)
-                    except ValueError:
-                        if param.default != inspect.Parameter.empty:
-                            resolved_kwargs[param_name] = param.default
+                # Sem resolução, usa o default (Parameter.empty quando não há)
+                resolved = container.try_resolve(param_type, default)
+                if resolved is not inspect.Parameter.empty:
+                    resolved_kwargs[param_name] = resolved
         
         return func(*args, **resolved_kwargs)
     
@@ -152,12 +182,16 @@ def inject_property(property_name: str, dependency_type: Type) -> Callable:
             def repository(self):
                 return self._repository
     """
+    attr_name = f'_{property_name}'
+    
     def decorator(func: Callable) -> Callable:
+        current_container = container_getter()
+        
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            if not hasattr(self, f'_{property_name}'):
-                container = get_container()
-                setattr(self, f'_{property_name}', container.resolve(dependency_type))
+            if not hasattr(self, attr_name):
+                container = current_container()
+                setattr(self, attr_name, container.resolve(dependency_type))
             return func(self, *args, **kwargs)
         
         return wrapper
@@ -173,12 +207,15 @@ def lazy_inject(dependency_type: Type) -> Callable:
             def repository(self):
                 return self._repository
     """
+    property_name = f'_{_dep_name(dependency_type)}'
+    
     def decorator(func: Callable) -> Callable:
+        current_container = container_getter()
+        
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            property_name = f'_{dependency_type.__name__.lower()}'
             if not hasattr(self, property_name):
-                container = get_container()
+                container = current_container()
                 setattr(self, property_name, container.resolve(dependency_type))
             return getattr(self, property_name)
         
@@ -195,16 +232,18 @@ def inject_config(config_key: str, default_value: Any = None) -> Callable:
             pass
     """
     def decorator(func: Callable) -> Callable:
+        current_container = container_getter()
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            container = get_container()
+            container = current_container()
             
             # Tenta resolver configuração
-            try:
-                config = container.resolve(type(default_value))
-                value = config.get(config_key, default_value)
-            except ValueError:
+            config = container.try_resolve(type(default_value), _MISSING)
+            if config is _MISSING:
                 value = default_value
+            else:
+                value = config.get(config_key, default_value)
             
             # Injeta valor como parâmetro
             param_name = config_key.lower()
@@ -224,20 +263,29 @@ def inject_environment(env_var: str, default_value: Any = None) -> Callable:
         @inject_environment('API_KEY', 'default_key')
         def my_function(api_key: str):
             pass
+    
+    O valor é lido na decoração; use my_function.reload() para reler.
     """
+    param_name = env_var.lower()
+    
     def decorator(func: Callable) -> Callable:
+        # Lido uma única vez; wrapper.reload() relê o ambiente
+        cached = [os.getenv(env_var, default_value)]
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import os
-            value = os.getenv(env_var, default_value)
-            
             # Injeta valor como parâmetro
-            param_name = env_var.lower()
             if param_name not in kwargs:
-                kwargs[param_name] = value
+                kwargs[param_name] = cached[0]
             
             return func(*args, **kwargs)
         
+        def reload() -> Any:
+            """Relê a variável de ambiente e retorna o novo valor"""
+            cached[0] = os.getenv(env_var, default_value)
+            return cached[0]
+        
+        wrapper.reload = reload
         return wrapper
     return decorator
 
@@ -251,9 +299,11 @@ def validate_dependencies(*required_types: Type) -> Callable:
             pass
     """
     def decorator(func: Callable) -> Callable:
+        current_container = container_getter()
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            container = get_container()
+            container = current_container()
             
             # Valida se todas as dependências estão registradas
             for dep_type in required_types:
@@ -274,20 +324,22 @@ def conditional_inject(condition: Callable[[], bool], *dependencies: Type) -> Ca
         def my_function(service: IProductionService):
             pass
     """
+    plan = _resolution_plan(dependencies)
+    
     def decorator(func: Callable) -> Callable:
+        current_container = container_getter()
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if condition():
-                container = get_container()
+                container = current_container()
                 resolved_kwargs = kwargs.copy()
                 
-                for dep_type in dependencies:
-                    dep_name = dep_type.__name__.lower()
+                for dep_name, dep_type in plan:
                     if dep_name not in resolved_kwargs:
-                        try:
-                            resolved_kwargs[dep_name] = container.resolve(dep_type)
-                        except ValueError:
-                            pass
+                        resolved = container.try_resolve(dep_type, _MISSING)
+                        if resolved is not _MISSING:
+                            resolved_kwargs[dep_name] = resolved
                 
                 return func(*args, **resolved_kwargs)
             else:
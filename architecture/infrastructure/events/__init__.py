@@ -3,7 +3,9 @@
 Sistema de eventos com padrão Observer para comunicação desacoplada
 """
 
-from .event_bus import EventBus, EventHandler
+import importlib
+
+from .event_bus import EventBus, EventHandler, EventRingBuffer
 from .event_handler import (
     TradeEventHandler, 
     StrategyEventHandler, 
@@ -12,12 +14,40 @@ from .event_handler import (
     NotificationEventHandler, 
     AuditEventHandler
 )
-from .events import *
 from .event_dispatcher import EventDispatcher, LoggingMiddleware, TimingMiddleware, ValidationMiddleware
 
+# Eventos carregados sob demanda (PEP 562): importar o pacote não executa a
+# maquinaria de dataclass dos grupos de eventos que não forem usados
+_LAZY_EVENTS = {
+    "BaseEvent": ".base_event",
+    "TradeExecutedEvent": ".trade_events",
+    "OrderCreatedEvent": ".order_events",
+    "OrderFilledEvent": ".order_events",
+    "OrderCancelledEvent": ".order_events",
+    "PositionOpenedEvent": ".position_events",
+    "PositionClosedEvent": ".position_events",
+    "StrategySignalEvent": ".strategy_events",
+    "ErrorEvent": ".system_events",
+    "SystemEvent": ".system_events",
+    "PerformanceEvent": ".system_events",
+    "NotificationEvent": ".system_events",
+}
+
+def __getattr__(name: str):
+    module_name = _LAZY_EVENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # próximos acessos não passam por __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EVENTS))
+
 __all__ = [
     "EventBus",
     "EventHandler",
+    "EventRingBuffer",
     "TradeEventHandler",
     "StrategyEventHandler", 
     "ErrorEventHandler",
@@ -36,5 +66,7 @@ __all__ = [
     "PositionClosedEvent",
     "StrategySignalEvent",
     "ErrorEvent",
-    "SystemEvent"
+    "SystemEvent",
+    "PerformanceEvent",
+    "NotificationEvent"
 ]
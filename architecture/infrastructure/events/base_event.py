@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+📡 BASE EVENT NEØ - EVENTO BASE
+Classe base dos eventos do sistema de trading
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Any, ClassVar, Tuple, Callable
+from datetime import datetime
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
+import uuid
+
+from ...core.interfaces import IEvent
+
+# =============================================================================
+# EVENTOS BASE
+# =============================================================================
+
+@dataclass(slots=True)
+class BaseEvent(IEvent):
+    """Evento base do sistema"""
+    # Nome do tipo, fixado uma vez por classe em __init_subclass__
+    event_type: ClassVar[str] = 'BaseEvent'
+    # Pool de instâncias reutilizáveis (um por classe, criado em __init_subclass__)
+    _POOL_MAX: ClassVar[int] = 64
+    _pool: ClassVar[List['BaseEvent']] = []
+    
+    # Keyword-only para que subclasses possam declarar campos obrigatórios
+    event_id: str = field(default_factory=lambda: str(uuid.uuid4()), kw_only=True)
+    timestamp_ns: int = field(default_factory=time.time_ns, kw_only=True)
+    source: str = field(default="system", kw_only=True)
+    metadata: Dict[str, Any] = field(default_factory=dict, kw_only=True)
+    # Dados montados na primeira chamada a get_data()
+    _data_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __init_subclass__(cls, **kwargs):
+        # super() sem argumentos não funciona em dataclasses com slots=True,
+        # que recriam a classe; por isso a classe é explícita aqui
+        super(BaseEvent, cls).__init_subclass__(**kwargs)
+        cls.event_type = cls.__name__
+        cls._pool = []
+    
+    @classmethod
+    def acquire(cls, *args, **kwargs) -> 'BaseEvent':
+        """
+        Obtém evento do pool (ou cria um novo) inicializado com os argumentos
+        
+        Todos os campos são reinicializados, inclusive event_id e timestamp.
+        """
+        pool = cls._pool
+        if not pool:
+            return cls(*args, **kwargs)
+        event = pool.pop()
+        event.__init__(*args, **kwargs)
+        return event
+    
+    def release(self) -> None:
+        """
+        Devolve o evento ao pool da sua classe
+        
+        Só deve ser chamado depois que publish retornou e quando nenhum
+        handler ou middleware guardou referência ao evento.
+        """
+        pool = type(self)._pool
+        if len(pool) < self._POOL_MAX:
+            self._data_cache = None
+            pool.append(self)
+    
+    def get_event_type(self) -> str:
+        return self.event_type
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Timestamp do evento, materializado como datetime apenas na leitura"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+    
+    def get_timestamp(self) -> datetime:
+        return self.timestamp
+    
+    def get_data(self) -> Dict[str, Any]:
+        """
+        Retorna cópia dos dados do evento
+        
+        O dicionário é montado uma única vez; quem alterar campos do evento
+        depois disso deve chamar invalidate_data().
+        """
+        data = self._data_cache
+        if data is None:
+            data = self._build_data()
+            self._data_cache = data
+        return dict(data)
+    
+    def invalidate_data(self) -> None:
+        """Descarta os dados em cache de get_data()"""
+        self._data_cache = None
+    
+    def _build_data(self) -> Dict[str, Any]:
+        """Monta os dados do evento: campos base seguidos dos campos da subclasse"""
+        data = {
+            'event_id': self.event_id,
+            'timestamp': self.timestamp.isoformat(),
+            'source': self.source,
+            'metadata': self.metadata
+        }
+        names, getter = _event_field_access(type(self))
+        if names:
+            data.update(zip(names, getter(self)))
+        return data
+
+@lru_cache(maxsize=None)
+def _event_field_access(event_class: type) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple]]:
+    """
+    Campos declarados pela subclasse de evento (na ordem de declaração) e um
+    attrgetter que lê todos de uma vez, sempre devolvendo tupla
+    """
+    names = tuple(f.name for f in fields(event_class) if f.name not in _BASE_FIELD_NAMES)
+    if len(names) == 1:
+        single = attrgetter(names[0])
+        return names, lambda event: (single(event),)
+    return names, (attrgetter(*names) if names else (lambda event: ()))
+
+_BASE_FIELD_NAMES = frozenset(f.name for f in fields(BaseEvent))
@@ -6,29 +6,132 @@ Sistema de barramento de eventos com padrão Observer
 
 import asyncio
 import threading
-from typing import Dict, List, Set, Optional, Any, Callable
-from collections import defaultdict
+from itertools import count, islice
+from typing import Dict, List, Optional, Any, Callable, Tuple, Awaitable, Sequence, Iterable, FrozenSet
 from datetime import datetime
 import logging
 
 from ...core.interfaces import IEventBus, IEvent, IEventHandler
 
+# Tupla vazia compartilhada para tipos de evento sem handlers
+_EMPTY: Tuple[IEventHandler, ...] = ()
+
+def _advance(counter: count, n: int) -> None:
+    """Avança o contador em n passos (consumo em C via islice)"""
+    if n:
+        next(islice(counter, n - 1, n), None)
+
+async def _passthrough(event: IEvent) -> IEvent:
+    """Último passo da cadeia de middleware"""
+    return event
+
+class EventRingBuffer:
+    """
+    Buffer circular pré-alocado para eventos (estilo Disruptor)
+    
+    Capacidade potência de 2: o slot é seq & mask. Produtor e consumidor
+    rodam no mesmo loop asyncio, então os cursores dispensam lock.
+    """
+    
+    __slots__ = ('_buf', '_mask', '_seq_pub', '_seq_con')
+    
+    def __init__(self, capacity: int = 4096):
+        if capacity < 1 or capacity & (capacity - 1):
+            raise ValueError("Ring buffer capacity must be a power of two")
+        self._buf: List[Optional[IEvent]] = [None] * capacity
+        self._mask = capacity - 1
+        self._seq_pub = 0
+        self._seq_con = 0
+    
+    def __len__(self) -> int:
+        return self._seq_pub - self._seq_con
+    
+    @property
+    def capacity(self) -> int:
+        return self._mask + 1
+    
+    def put(self, event: IEvent) -> bool:
+        """Grava evento no próximo slot; False se o buffer estiver cheio"""
+        seq = self._seq_pub
+        if seq - self._seq_con > self._mask:
+            return False
+        self._buf[seq & self._mask] = event
+        self._seq_pub = seq + 1
+        return True
+    
+    def drain(self) -> List[IEvent]:
+        """Retira todos os eventos disponíveis, em ordem, liberando os slots"""
+        start = self._seq_con
+        n = self._seq_pub - start
+        if not n:
+            return []
+        buf = self._buf
+        first = start & self._mask
+        end = first + n
+        if end <= len(buf):
+            events = buf[first:end]
+            buf[first:end] = [None] * n
+        else:
+            # Volta ao início do buffer
+            end -= len(buf)
+            events = buf[first:] + buf[:end]
+            buf[first:] = [None] * (len(buf) - first)
+            buf[:end] = [None] * end
+        self._seq_con = start + n
+        return events
+
 class EventBus(IEventBus):
     """
     Barramento de eventos com suporte a handlers assíncronos
     """
     
-    def __init__(self):
-        self._handlers: Dict[str, Set[IEventHandler]] = defaultdict(set)
+    def __init__(self, ring_capacity: int = 4096):
+        # Copy-on-write: tuplas substituídas em subscribe/unsubscribe,
+        # lidas sem lock e sem cópia em publish
+        self._handlers: Dict[str, Tuple[IEventHandler, ...]] = {}
         self._middleware: List[Callable] = []
-        self._lock = threading.RLock()
+        # Middleware com efeitos próprios; os demais são apenas observadores
+        self._mutating_middleware: List[Callable] = []
+        # Cadeia de middleware compilada; None quando não há middleware
+        self._middleware_chain: Optional[Callable[[IEvent], Awaitable[Optional[IEvent]]]] = None
+        # Middleware restrito a tipos de evento e cadeias compiladas por tipo
+        # (globais + restritos ao tipo, na ordem de registro)
+        self._middleware_types: Dict[Callable, FrozenSet[str]] = {}
+        self._typed_middleware_chains: Dict[str, Callable[[IEvent], Awaitable[Optional[IEvent]]]] = {}
+        # Locks separados: mutação de handlers (rara) e leitura de
+        # estatísticas; publish não usa nenhum dos dois
+        self._handlers_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
-        self._stats = {
-            'events_published': 0,
-            'events_handled': 0,
-            'handlers_registered': 0,
-            'errors': 0
-        }
+        self._handlers_registered = 0
+        # Fila de post(): eventos de produtores síncronos, drenados em lote
+        self._ring = EventRingBuffer(ring_capacity)
+        self._drain_task: Optional[asyncio.Task] = None
+        self._events_dropped = 0
+        self._reset_counters()
+    
+    def _reset_counters(self) -> None:
+        """
+        Recria contadores do caminho de publicação
+        
+        next() em itertools.count é atômico sob o GIL, então publish e
+        _execute_handler incrementam sem lock. Cada leitura em get_stats
+        também avança os contadores; _counter_reads desconta essas leituras.
+        """
+        self._c_published = count()
+        self._c_handled = count()
+        self._c_errors = count()
+        self._counter_reads = 0
+    
+    def _read_counters(self) -> Tuple[int, int, int]:
+        """Retorna (publicados, processados, erros); chamar com self._stats_lock"""
+        reads = self._counter_reads
+        self._counter_reads = reads + 1
+        return (
+            next(self._c_published) - reads,
+            next(self._c_handled) - reads,
+            next(self._c_errors) - reads
+        )
     
     async def publish(self, event: IEvent) -> None:
         """
@@ -39,35 +142,175 @@ class EventBus(IEventBus):
         """
         event_type = event.get_event_type()
         
-        with self._lock:
-            self._stats['events_published'] += 1
+        next(self._c_published)
         
-        # Aplica middleware
-        for middleware in self._middleware:
-            try:
-                event = await middleware(event)
-                if event is None:
-                    return  # Middleware cancelou o evento
-            except Exception as e:
-                self._logger.error(f"Error in middleware: {e}")
-                self._stats['errors'] += 1
+        # Sem handlers, só middleware que altera estado precisa rodar
+        handlers = self._handlers.get(event_type, _EMPTY)
+        if not handlers and not self._mutating_middleware:
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("No handlers for event type: %s", event_type)
+            return
         
-        # Obtém handlers para o tipo de evento
-        with self._lock:
-            handlers = self._handlers[event_type].copy()
+        # Aplica middleware
+        chain = self._typed_middleware_chains.get(event_type, self._middleware_chain)
+        if chain is not None:
+            event = await chain(event)
+            if event is None:
+                return  # Middleware cancelou o evento
+            
+            # Relê handlers, que podem ter mudado durante o middleware
+            handlers = self._handlers.get(event_type, _EMPTY)
         
         if not handlers:
-            self._logger.debug(f"No handlers for event type: {event_type}")
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("No handlers for event type: %s", event_type)
             return
         
-        # Executa handlers em paralelo
-        tasks = []
-        for handler in handlers:
-            task = self._execute_handler(handler, event)
-            tasks.append(task)
+        # Um único handler: executa direto, sem criar Task
+        if len(handlers) == 1:
+            await self._execute_handler(handlers[0], event)
+            return
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        # Executa handlers em paralelo; erros voltam como resultado e os
+        # contadores são atualizados uma vez por lote
+        results = await asyncio.gather(
+            *[handler.handle(event) for handler in handlers],
+            return_exceptions=True
+        )
+        handled = errors = 0
+        interrupt = None
+        for handler, result in zip(handlers, results):
+            if not isinstance(result, BaseException):
+                handled += 1
+            elif isinstance(result, Exception):
+                errors += 1
+                self._logger.error("Error in handler %s: %s", handler.__class__.__name__, result)
+            elif interrupt is None:
+                interrupt = result
+        _advance(self._c_handled, handled)
+        _advance(self._c_errors, errors)
+        # Cancelamento/interrupção propaga como no caminho de handler único
+        if interrupt is not None:
+            raise interrupt
+    
+    async def publish_many(self, events: Sequence[IEvent]) -> None:
+        """
+        Publica lote de eventos
+        
+        O middleware roda por evento; depois os eventos são agrupados por tipo
+        e cada handler recebe os do seu tipo em uma única tarefa. Handlers que
+        implementam handle_batch(events) recebem o lote inteiro de uma vez.
+        
+        Args:
+            events: Eventos a serem publicados
+        """
+        _advance(self._c_published, len(events))
+        
+        global_chain = self._middleware_chain
+        typed_chains = self._typed_middleware_chains
+        mutating = bool(self._mutating_middleware)
+        grouped: Dict[str, List[IEvent]] = {}
+        
+        for event in events:
+            event_type = event.get_event_type()
+            
+            # Mesmo atalho de publish para tipos sem handlers
+            if not mutating and event_type not in self._handlers:
+                continue
+            
+            chain = typed_chains.get(event_type, global_chain)
+            if chain is not None:
+                event = await chain(event)
+                if event is None:
+                    continue  # Middleware cancelou o evento
+            
+            grouped.setdefault(event_type, []).append(event)
+        
+        tasks = [
+            self._execute_batch(handler, batch)
+            for event_type, batch in grouped.items()
+            for handler in self._handlers.get(event_type, _EMPTY)
+        ]
+        
+        if len(tasks) == 1:
+            await tasks[0]
+        elif tasks:
+            # _execute_batch já trata Exception; só cancelamento/interrupção volta aqui
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException) and not isinstance(result, Exception):
+                    raise result
+    
+    def post(self, event: IEvent) -> bool:
+        """
+        Enfileira evento sem aguardar os handlers
+        
+        Para produtores síncronos (callbacks) rodando no loop asyncio. Os
+        eventos vão para o ring buffer e são publicados em lote via
+        publish_many por uma única tarefa de drenagem.
+        
+        Args:
+            event: Evento a ser publicado
+            
+        Returns:
+            bool: False se o buffer estava cheio e o evento foi descartado
+        """
+        if not self._ring.put(event):
+            self._events_dropped += 1
+            self._logger.warning("Event ring buffer full, dropping %s", event.get_event_type())
+            return False
+        if self._drain_task is None:
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain_ring())
+        return True
+    
+    async def _drain_ring(self) -> None:
+        """Publica eventos enfileirados por post() até esvaziar o buffer"""
+        try:
+            while self._ring:
+                await self.publish_many(self._ring.drain())
+        except Exception as e:
+            self._logger.error("Error draining posted events: %s", e)
+        finally:
+            self._drain_task = None
+    
+    async def wait_posted(self) -> None:
+        """Aguarda a publicação dos eventos enfileirados por post()"""
+        while self._drain_task is not None:
+            await asyncio.shield(self._drain_task)
+        if self._ring:
+            # Sobra de uma drenagem interrompida por erro
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain_ring())
+            await self._drain_task
+    
+    async def _execute_batch(self, handler: IEventHandler, events: List[IEvent]) -> None:
+        """
+        Executa handler sobre lote de eventos do mesmo tipo
+        
+        Args:
+            handler: Handler a ser executado
+            events: Eventos a serem processados
+        """
+        handle_batch = getattr(handler, 'handle_batch', None)
+        if handle_batch is not None:
+            try:
+                await handle_batch(events)
+                _advance(self._c_handled, len(events))
+            except Exception as e:
+                self._logger.error("Error in handler %s: %s", handler.__class__.__name__, e)
+                # Um erro por evento do lote, como no caminho evento a evento
+                _advance(self._c_errors, len(events))
+            return
+        
+        handled = errors = 0
+        for event in events:
+            try:
+                await handler.handle(event)
+                handled += 1
+            except Exception as e:
+                errors += 1
+                self._logger.error("Error in handler %s: %s", handler.__class__.__name__, e)
+        _advance(self._c_handled, handled)
+        _advance(self._c_errors, errors)
     
     async def _execute_handler(self, handler: IEventHandler, event: IEvent) -> None:
         """
@@ -79,12 +322,10 @@ class EventBus(IEventBus):
         """
         try:
             await handler.handle(event)
-            with self._lock:
-                self._stats['events_handled'] += 1
+            next(self._c_handled)
         except Exception as e:
-            self._logger.error(f"Error in handler {handler.__class__.__name__}: {e}")
-            with self._lock:
-                self._stats['errors'] += 1
+            self._logger.error("Error in handler %s: %s", handler.__class__.__name__, e)
+            next(self._c_errors)
     
     def subscribe(self, event_type: str, handler: IEventHandler) -> None:
         """
@@ -94,11 +335,13 @@ class EventBus(IEventBus):
             event_type: Tipo do evento
             handler: Handler a ser inscrito
         """
-        with self._lock:
-            self._handlers[event_type].add(handler)
-            self._stats['handlers_registered'] += 1
+        with self._handlers_lock:
+            handlers = self._handlers.get(event_type, _EMPTY)
+            if handler not in handlers:
+                self._handlers[event_type] = handlers + (handler,)
+            self._handlers_registered += 1
         
-        self._logger.debug(f"Handler {handler.__class__.__name__} subscribed to {event_type}")
+        self._logger.debug("Handler %s subscribed to %s", handler.__class__.__name__, event_type)
     
     def unsubscribe(self, event_type: str, handler: IEventHandler) -> None:
         """
@@ -108,22 +351,78 @@ class EventBus(IEventBus):
             event_type: Tipo do evento
             handler: Handler a ser removido
         """
-        with self._lock:
-            if handler in self._handlers[event_type]:
-                self._handlers[event_type].remove(handler)
-                self._stats['handlers_registered'] -= 1
+        with self._handlers_lock:
+            handlers = self._handlers.get(event_type, _EMPTY)
+            if handler in handlers:
+                remaining = tuple(h for h in handlers if h is not handler)
+                if remaining:
+                    self._handlers[event_type] = remaining
+                else:
+                    del self._handlers[event_type]
+                self._handlers_registered -= 1
         
-        self._logger.debug(f"Handler {handler.__class__.__name__} unsubscribed from {event_type}")
+        self._logger.debug("Handler %s unsubscribed from %s", handler.__class__.__name__, event_type)
     
-    def add_middleware(self, middleware: Callable) -> None:
+    def _wrap_middleware(self, middleware: Callable, next_step: Callable) -> Callable:
+        """Encadeia middleware ao próximo passo da cadeia"""
+        async def step(event: IEvent) -> Optional[IEvent]:
+            try:
+                result = await middleware(event)
+            except Exception as e:
+                # Erro no middleware não cancela o evento
+                self._logger.error("Error in middleware: %s", e)
+                next(self._c_errors)
+                result = event
+            if result is None:
+                return None
+            return await next_step(result)
+        return step
+    
+    def _compile_chain(self, middleware_list: List[Callable]) -> Optional[Callable]:
+        """Compila lista de middleware em uma única corrotina"""
+        if not middleware_list:
+            return None
+        chain = _passthrough
+        for middleware in reversed(middleware_list):
+            chain = self._wrap_middleware(middleware, chain)
+        return chain
+    
+    def _rebuild_middleware_chain(self) -> None:
+        """Recompila a cadeia global e as cadeias por tipo de evento"""
+        scopes = self._middleware_types
+        self._middleware_chain = self._compile_chain(
+            [m for m in self._middleware if m not in scopes]
+        )
+        event_types = set().union(*scopes.values())
+        self._typed_middleware_chains = {
+            event_type: self._compile_chain([
+                m for m in self._middleware
+                if m not in scopes or event_type in scopes[m]
+            ])
+            for event_type in event_types
+        }
+    
+    def add_middleware(self, middleware: Callable, mutates: bool = False,
+                       event_types: Optional[Iterable[str]] = None) -> None:
         """
         Adiciona middleware ao barramento
         
         Args:
             middleware: Função middleware
+            mutates: True se o middleware tem efeitos que devem ocorrer mesmo
+                sem handlers inscritos; observadores (logging, timing) são
+                pulados quando o tipo de evento não tem handlers
+            event_types: Tipos de evento aos quais o middleware se aplica;
+                None aplica a todos. Eventos de outros tipos nem aguardam
+                o middleware
         """
         self._middleware.append(middleware)
-        self._logger.debug(f"Middleware {middleware.__name__} added")
+        if mutates:
+            self._mutating_middleware.append(middleware)
+        if event_types is not None:
+            self._middleware_types[middleware] = frozenset(event_types)
+        self._rebuild_middleware_chain()
+        self._logger.debug("Middleware %s added", getattr(middleware, '__name__', type(middleware).__name__))
     
     def remove_middleware(self, middleware: Callable) -> None:
         """
@@ -134,7 +433,12 @@ class EventBus(IEventBus):
         """
         if middleware in self._middleware:
             self._middleware.remove(middleware)
-            self._logger.debug(f"Middleware {middleware.__name__} removed")
+            if middleware in self._mutating_middleware:
+                self._mutating_middleware.remove(middleware)
+            if middleware not in self._middleware:
+                self._middleware_types.pop(middleware, None)
+            self._rebuild_middleware_chain()
+            self._logger.debug("Middleware %s removed", getattr(middleware, '__name__', type(middleware).__name__))
     
     def get_subscribers(self, event_type: str) -> List[IEventHandler]:
         """
@@ -146,8 +450,7 @@ class EventBus(IEventBus):
         Returns:
             List[IEventHandler]: Lista de handlers
         """
-        with self._lock:
-            return list(self._handlers[event_type])
+        return list(self._handlers.get(event_type, _EMPTY))
     
     def get_all_event_types(self) -> List[str]:
         """
@@ -156,8 +459,7 @@ class EventBus(IEventBus):
         Returns:
             List[str]: Lista de tipos de eventos
         """
-        with self._lock:
-            return list(self._handlers.keys())
+        return list(self._handlers)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -166,48 +468,56 @@ class EventBus(IEventBus):
         Returns:
             Dict[str, Any]: Estatísticas
         """
-        with self._lock:
-            return {
-                'events_published': self._stats['events_published'],
-                'events_handled': self._stats['events_handled'],
-                'handlers_registered': self._stats['handlers_registered'],
-                'errors': self._stats['errors'],
-                'event_types': len(self._handlers),
-                'middleware_count': len(self._middleware),
-                'success_rate': (
-                    self._stats['events_handled'] / self._stats['events_published']
-                    if self._stats['events_published'] > 0 else 0
-                )
-            }
+        with self._stats_lock:
+            published, handled, errors = self._read_counters()
+        return {
+            'events_published': published,
+            'events_handled': handled,
+            'handlers_registered': self._handlers_registered,
+            'errors': errors,
+            'event_types': len(self._handlers),
+            'middleware_count': len(self._middleware),
+            'events_pending': len(self._ring),
+            'events_dropped': self._events_dropped,
+            'success_rate': (
+                handled / published
+                if published > 0 else 0
+            )
+        }
     
     def clear_stats(self) -> None:
         """Limpa estatísticas"""
-        with self._lock:
-            self._stats = {
-                'events_published': 0,
-                'events_handled': 0,
-                'handlers_registered': 0,
-                'errors': 0
-            }
+        with self._stats_lock:
+            self._reset_counters()
+            self._events_dropped = 0
+        with self._handlers_lock:
+            self._handlers_registered = 0
     
     def clear_handlers(self) -> None:
         """Limpa todos os handlers"""
-        with self._lock:
+        with self._handlers_lock:
             self._handlers.clear()
-            self._stats['handlers_registered'] = 0
+            self._handlers_registered = 0
     
     def clear_middleware(self) -> None:
         """Limpa todos os middleware"""
         self._middleware.clear()
+        self._mutating_middleware.clear()
+        self._middleware_types.clear()
+        self._middleware_chain = None
+        self._typed_middleware_chains = {}
 
 class EventHandler(IEventHandler):
     """
     Handler base para eventos
     """
     
+    __slots__ = ('event_types', 'handled_count', 'error_count', 'logger')
+    
     def __init__(self, event_types: List[str]):
         self.event_types = event_types
-        self.handled_events = []
+        # Só a contagem é usada; guardar os eventos crescia sem limite
+        self.handled_count = 0
         self.error_count = 0
     
     async def handle(self, event: IEvent) -> None:
@@ -219,7 +529,7 @@ class EventHandler(IEventHandler):
         """
         try:
             await self._process_event(event)
-            self.handled_events.append(event)
+            self.handled_count += 1
         except Exception as e:
             self.error_count += 1
             raise e
@@ -254,11 +564,11 @@ class EventHandler(IEventHandler):
         """
         return {
             'event_types': self.event_types,
-            'handled_events': len(self.handled_events),
+            'handled_events': self.handled_count,
             'error_count': self.error_count,
             'success_rate': (
-                len(self.handled_events) / (len(self.handled_events) + self.error_count)
-                if (len(self.handled_events) + self.error_count) > 0 else 0
+                self.handled_count / (self.handled_count + self.error_count)
+                if (self.handled_count + self.error_count) > 0 else 0
             )
         }
 
@@ -269,6 +579,10 @@ _event_bus_lock = threading.RLock()
 def get_event_bus() -> EventBus:
     """Obtém instância global do event bus"""
     global _event_bus
+    # Leitura sem lock; o lock só é usado na criação
+    event_bus = _event_bus
+    if event_bus is not None:
+        return event_bus
     with _event_bus_lock:
         if _event_bus is None:
             _event_bus = EventBus()
@@ -6,13 +6,21 @@ Sistema de despacho de eventos com middleware e filtros
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Callable
-from datetime import datetime
-from collections import defaultdict
+import time
+import threading
+from collections import deque, OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Deque, Tuple, FrozenSet
 
 from ...core.interfaces import IEvent, IEventHandler
 from .event_bus import EventBus, get_event_bus
 
+# Tipo de evento sem filtros nem handlers locais
+_EMPTY_CHAIN: Tuple[Tuple[Callable, ...], Tuple[IEventHandler, ...]] = ((), ())
+
+async def _passthrough(event: IEvent) -> IEvent:
+    """Último passo da cadeia de middleware"""
+    return event
+
 class EventDispatcher:
     """
     Dispatcher de eventos com middleware e filtros
@@ -22,8 +30,12 @@ class EventDispatcher:
         self.event_bus = event_bus or get_event_bus()
         self.logger = logging.getLogger(__name__)
         self.middleware: List[Callable] = []
-        self.filters: Dict[str, List[Callable]] = defaultdict(list)
-        self.handlers: Dict[str, List[IEventHandler]] = defaultdict(list)
+        # Cadeia de middleware compilada; None quando não há middleware
+        self._middleware_chain: Optional[Callable[[IEvent], Awaitable[Optional[IEvent]]]] = None
+        self.filters: Dict[str, List[Callable]] = {}
+        self.handlers: Dict[str, List[IEventHandler]] = {}
+        # (filtros, handlers) congelados por tipo; refeito a cada alteração
+        self._chains: Dict[str, Tuple[Tuple[Callable, ...], Tuple[IEventHandler, ...]]] = {}
         self.stats = {
             'events_dispatched': 0,
             'events_filtered': 0,
@@ -31,38 +43,76 @@ class EventDispatcher:
             'errors': 0
         }
     
+    def _wrap_middleware(self, middleware: Callable, next_step: Callable) -> Callable:
+        """Encadeia middleware ao próximo passo da cadeia"""
+        async def step(event: IEvent) -> Optional[IEvent]:
+            event = await middleware(event)
+            if event is None:
+                self.logger.debug("Evento cancelado por middleware: %s", middleware.__name__)
+                return None
+            return await next_step(event)
+        return step
+    
+    def _rebuild_middleware_chain(self) -> None:
+        """Compila a lista de middleware em uma única corrotina"""
+        chain = _passthrough
+        for middleware in reversed(self.middleware):
+            chain = self._wrap_middleware(middleware, chain)
+        self._middleware_chain = chain if self.middleware else None
+    
     def add_middleware(self, middleware: Callable) -> None:
         """Adiciona middleware ao dispatcher"""
         self.middleware.append(middleware)
-        self.logger.debug(f"Middleware adicionado: {middleware.__name__}")
+        self._rebuild_middleware_chain()
+        self.logger.debug("Middleware adicionado: %s", middleware.__name__)
     
     def remove_middleware(self, middleware: Callable) -> None:
         """Remove middleware do dispatcher"""
         if middleware in self.middleware:
             self.middleware.remove(middleware)
-            self.logger.debug(f"Middleware removido: {middleware.__name__}")
+            self._rebuild_middleware_chain()
+            self.logger.debug("Middleware removido: %s", middleware.__name__)
+    
+    def _rebuild_chain(self, event_type: str) -> None:
+        """Refaz a tupla (filtros, handlers) do tipo de evento"""
+        filters = tuple(self.filters.get(event_type, ()))
+        handlers = tuple(self.handlers.get(event_type, ()))
+        if filters or handlers:
+            self._chains[event_type] = (filters, handlers)
+        else:
+            self._chains.pop(event_type, None)
     
     def add_filter(self, event_type: str, filter_func: Callable) -> None:
         """Adiciona filtro para tipo de evento"""
-        self.filters[event_type].append(filter_func)
-        self.logger.debug(f"Filtro adicionado para {event_type}: {filter_func.__name__}")
+        self.filters.setdefault(event_type, []).append(filter_func)
+        self._rebuild_chain(event_type)
+        self.logger.debug("Filtro adicionado para %s: %s", event_type, filter_func.__name__)
     
     def remove_filter(self, event_type: str, filter_func: Callable) -> None:
         """Remove filtro para tipo de evento"""
-        if filter_func in self.filters[event_type]:
-            self.filters[event_type].remove(filter_func)
-            self.logger.debug(f"Filtro removido para {event_type}: {filter_func.__name__}")
+        filters = self.filters.get(event_type)
+        if filters and filter_func in filters:
+            filters.remove(filter_func)
+            if not filters:
+                del self.filters[event_type]
+            self._rebuild_chain(event_type)
+            self.logger.debug("Filtro removido para %s: %s", event_type, filter_func.__name__)
     
     def add_handler(self, event_type: str, handler: IEventHandler) -> None:
         """Adiciona handler para tipo de evento"""
-        self.handlers[event_type].append(handler)
-        self.logger.debug(f"Handler adicionado para {event_type}: {handler.__class__.__name__}")
+        self.handlers.setdefault(event_type, []).append(handler)
+        self._rebuild_chain(event_type)
+        self.logger.debug("Handler adicionado para %s: %s", event_type, handler.__class__.__name__)
     
     def remove_handler(self, event_type: str, handler: IEventHandler) -> None:
         """Remove handler para tipo de evento"""
-        if handler in self.handlers[event_type]:
-            self.handlers[event_type].remove(handler)
-            self.logger.debug(f"Handler removido para {event_type}: {handler.__class__.__name__}")
+        handlers = self.handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self.handlers[event_type]
+            self._rebuild_chain(event_type)
+            self.logger.debug("Handler removido para %s: %s", event_type, handler.__class__.__name__)
     
     async def dispatch(self, event: IEvent) -> None:
         """
@@ -75,37 +125,37 @@ class EventDispatcher:
         
         try:
             # Aplica middleware
-            for middleware in self.middleware:
-                event = await middleware(event)
+            chain = self._middleware_chain
+            if chain is not None:
+                event = await chain(event)
                 if event is None:
-                    self.logger.debug(f"Evento cancelado por middleware: {middleware.__name__}")
                     return
             
+            filters, handlers = self._chains.get(event_type, _EMPTY_CHAIN)
+            
             # Aplica filtros
-            if event_type in self.filters:
-                for filter_func in self.filters[event_type]:
-                    if not await filter_func(event):
-                        self.stats['events_filtered'] += 1
-                        self.logger.debug(f"Evento filtrado: {event_type}")
-                        return
+            for filter_func in filters:
+                if not await filter_func(event):
+                    self.stats['events_filtered'] += 1
+                    self.logger.debug("Evento filtrado: %s", event_type)
+                    return
             
             # Despacha para event bus
             await self.event_bus.publish(event)
             
             # Despacha para handlers locais
-            if event_type in self.handlers:
-                for handler in self.handlers[event_type]:
-                    try:
-                        await handler.handle(event)
-                    except Exception as e:
-                        self.logger.error(f"Erro no handler {handler.__class__.__name__}: {e}")
-                        self.stats['errors'] += 1
+            for handler in handlers:
+                try:
+                    await handler.handle(event)
+                except Exception as e:
+                    self.logger.error("Erro no handler %s: %s", handler.__class__.__name__, e)
+                    self.stats['errors'] += 1
             
             self.stats['events_dispatched'] += 1
             self.stats['events_processed'] += 1
             
         except Exception as e:
-            self.logger.error(f"Erro ao despachar evento {event_type}: {e}")
+            self.logger.error("Erro ao despachar evento %s: %s", event_type, e)
             self.stats['errors'] += 1
     
     def get_stats(self) -> Dict[str, Any]:
@@ -142,47 +192,75 @@ class LoggingMiddleware:
     
     async def __call__(self, event: IEvent) -> IEvent:
         """Aplica logging ao evento"""
-        self.logger.debug(f"Evento recebido: {event.get_event_type()}")
+        self.logger.debug("Evento recebido: %s", event.get_event_type())
         return event
 
 class TimingMiddleware:
     """Middleware para medição de tempo"""
     
-    def __init__(self):
-        self.times = {}
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0):
+        # event_id -> instante (time.monotonic_ns), em ordem de chegada;
+        # limitado em tamanho e idade para não crescer sem fim
+        self.times: 'OrderedDict[str, int]' = OrderedDict()
+        self.maxsize = maxsize
+        self._ttl_ns = int(ttl * 1_000_000_000)
     
     async def __call__(self, event: IEvent) -> IEvent:
         """Aplica timing ao evento"""
-        event_type = event.get_event_type()
-        self.times[event_type] = datetime.now()
+        now = time.monotonic_ns()
+        times = self.times
+        
+        # Por event_id, para eventos concorrentes do mesmo tipo não se
+        # sobrescreverem; eventos sem id caem no tipo
+        key = getattr(event, 'event_id', None) or event.get_event_type()
+        times.pop(key, None)
+        times[key] = now
+        
+        # Remove entradas expiradas ou excedentes (as mais antigas vêm primeiro)
+        cutoff = now - self._ttl_ns
+        while times:
+            oldest_key = next(iter(times))
+            if times[oldest_key] > cutoff and len(times) <= self.maxsize:
+                break
+            del times[oldest_key]
+        
         return event
     
-    def get_timing(self, event_type: str) -> Optional[datetime]:
-        """Obtém tempo de processamento"""
-        return self.times.get(event_type)
+    def get_timing(self, key: str) -> Optional[int]:
+        """Obtém instante (time.monotonic_ns) do evento pelo event_id"""
+        timestamp = self.times.get(key)
+        if timestamp is None or time.monotonic_ns() - timestamp > self._ttl_ns:
+            return None
+        return timestamp
 
 class ValidationMiddleware:
     """Middleware para validação de eventos"""
     
     def __init__(self):
-        self.required_fields = {
-            'TradeExecutedEvent': ['symbol', 'side', 'quantity', 'price'],
-            'OrderCreatedEvent': ['order_id', 'symbol', 'side', 'quantity'],
-            'ErrorEvent': ['error_type', 'error_message']
+        self.required_fields: Dict[str, FrozenSet[str]] = {
+            'TradeExecutedEvent': frozenset(['symbol', 'side', 'quantity', 'price']),
+            'OrderCreatedEvent': frozenset(['order_id', 'symbol', 'side', 'quantity']),
+            'ErrorEvent': frozenset(['error_type', 'error_message'])
         }
     
+    @property
+    def event_types(self) -> FrozenSet[str]:
+        """Tipos validados; usar em EventBus.add_middleware(event_types=...)"""
+        return frozenset(self.required_fields)
+    
     async def __call__(self, event: IEvent) -> Optional[IEvent]:
         """Valida evento"""
         event_type = event.get_event_type()
         
-        if event_type in self.required_fields:
-            data = event.get_data()
-            required_fields = self.required_fields[event_type]
-            
-            for field in required_fields:
-                if field not in data:
-                    logging.error(f"Campo obrigatório ausente: {field} em {event_type}")
-                    return None
+        required = self.required_fields.get(event_type)
+        if required is None:
+            return event
+        
+        # Diferença de conjuntos em C, reportando todos os campos ausentes
+        missing = required - event.get_data().keys()
+        if missing:
+            logging.error("Campos obrigatórios ausentes: %s em %s", ", ".join(sorted(missing)), event_type)
+            return None
         
         return event
 
@@ -192,21 +270,25 @@ class RateLimitFilter:
     
     def __init__(self, max_events_per_minute: int = 100):
         self.max_events = max_events_per_minute
-        self.events = []
+        # Instantes (time.monotonic) dos eventos aceitos, em ordem crescente
+        self.events: Deque[float] = deque(maxlen=max(max_events_per_minute, 0))
     
     async def __call__(self, event: IEvent) -> bool:
         """Aplica rate limiting"""
-        now = datetime.now()
+        now = time.monotonic()
         
         # Remove eventos antigos
-        self.events = [e for e in self.events if (now - e).total_seconds() < 60]
+        events = self.events
+        cutoff = now - 60.0
+        while events and events[0] <= cutoff:
+            events.popleft()
         
         # Verifica limite
-        if len(self.events) >= self.max_events:
-            logging.warning(f"Rate limit excedido: {len(self.events)} eventos no último minuto")
+        if len(events) >= self.max_events:
+            logging.warning("Rate limit excedido: %s eventos no último minuto", len(events))
             return False
         
-        self.events.append(now)
+        events.append(now)
         return True
 
 class PriorityFilter:
@@ -225,20 +307,28 @@ class PriorityFilter:
 
 # Instância global do dispatcher
 _dispatcher: Optional[EventDispatcher] = None
+_dispatcher_lock = threading.RLock()
 
 def get_dispatcher() -> EventDispatcher:
     """Obtém instância global do dispatcher"""
     global _dispatcher
-    if _dispatcher is None:
-        _dispatcher = EventDispatcher()
-    return _dispatcher
+    # Leitura sem lock; o lock só é usado na criação
+    dispatcher = _dispatcher
+    if dispatcher is not None:
+        return dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = EventDispatcher()
+        return _dispatcher
 
 def set_dispatcher(dispatcher: EventDispatcher) -> None:
     """Define instância global do dispatcher"""
     global _dispatcher
-    _dispatcher = dispatcher
+    with _dispatcher_lock:
+        _dispatcher = dispatcher
 
 def clear_dispatcher() -> None:
     """Limpa instância global do dispatcher"""
     global _dispatcher
-    _dispatcher = None
+    with _dispatcher_lock:
+        _dispatcher = None
@@ -16,27 +16,28 @@ class TradeEventHandler(BaseEventHandler):
     Handler para eventos de trading
     """
     
+    __slots__ = ('_dispatch_map',)
+    
     def __init__(self):
         super().__init__(['TradeExecutedEvent', 'OrderCreatedEvent', 'OrderFilledEvent', 'OrderCancelledEvent'])
         self.logger = logging.getLogger(__name__)
+        self._dispatch_map = {
+            'TradeExecutedEvent': self._handle_trade_executed,
+            'OrderCreatedEvent': self._handle_order_created,
+            'OrderFilledEvent': self._handle_order_filled,
+            'OrderCancelledEvent': self._handle_order_cancelled
+        }
     
     async def _process_event(self, event: IEvent) -> None:
         """Processa eventos de trading"""
-        event_type = event.get_event_type()
-        
-        if event_type == 'TradeExecutedEvent':
-            await self._handle_trade_executed(event)
-        elif event_type == 'OrderCreatedEvent':
-            await self._handle_order_created(event)
-        elif event_type == 'OrderFilledEvent':
-            await self._handle_order_filled(event)
-        elif event_type == 'OrderCancelledEvent':
-            await self._handle_order_cancelled(event)
+        handler = self._dispatch_map.get(event.get_event_type())
+        if handler is not None:
+            await handler(event)
     
     async def _handle_trade_executed(self, event: IEvent) -> None:
         """Processa trade executado"""
         data = event.get_data()
-        self.logger.info(f"Trade executado: {data['symbol']} - {data['side']} - {data['quantity']}")
+        self.logger.info("Trade executado: %s - %s - %s", data['symbol'], data['side'], data['quantity'])
         
         # Aqui você poderia:
         # - Atualizar banco de dados
@@ -47,42 +48,44 @@ class TradeEventHandler(BaseEventHandler):
     async def _handle_order_created(self, event: IEvent) -> None:
         """Processa ordem criada"""
         data = event.get_data()
-        self.logger.info(f"Ordem criada: {data['symbol']} - {data['side']} - {data['quantity']}")
+        self.logger.info("Ordem criada: %s - %s - %s", data['symbol'], data['side'], data['quantity'])
     
     async def _handle_order_filled(self, event: IEvent) -> None:
         """Processa ordem executada"""
         data = event.get_data()
-        self.logger.info(f"Ordem executada: {data['symbol']} - {data['filled_quantity']} - {data['filled_price']}")
+        self.logger.info("Ordem executada: %s - %s - %s", data['symbol'], data['filled_quantity'], data['filled_price'])
     
     async def _handle_order_cancelled(self, event: IEvent) -> None:
         """Processa ordem cancelada"""
         data = event.get_data()
-        self.logger.info(f"Ordem cancelada: {data['symbol']} - {data['reason']}")
+        self.logger.info("Ordem cancelada: %s - %s", data['symbol'], data['reason'])
 
 class StrategyEventHandler(BaseEventHandler):
     """
     Handler para eventos de estratégia
     """
     
+    __slots__ = ('_dispatch_map',)
+    
     def __init__(self):
         super().__init__(['StrategySignalEvent', 'StrategyStartedEvent', 'StrategyStoppedEvent'])
         self.logger = logging.getLogger(__name__)
+        self._dispatch_map = {
+            'StrategySignalEvent': self._handle_strategy_signal,
+            'StrategyStartedEvent': self._handle_strategy_started,
+            'StrategyStoppedEvent': self._handle_strategy_stopped
+        }
     
     async def _process_event(self, event: IEvent) -> None:
         """Processa eventos de estratégia"""
-        event_type = event.get_event_type()
-        
-        if event_type == 'StrategySignalEvent':
-            await self._handle_strategy_signal(event)
-        elif event_type == 'StrategyStartedEvent':
-            await self._handle_strategy_started(event)
-        elif event_type == 'StrategyStoppedEvent':
-            await self._handle_strategy_stopped(event)
+        handler = self._dispatch_map.get(event.get_event_type())
+        if handler is not None:
+            await handler(event)
     
     async def _handle_strategy_signal(self, event: IEvent) -> None:
         """Processa sinal de estratégia"""
         data = event.get_data()
-        self.logger.info(f"Sinal de estratégia: {data['strategy_name']} - {data['symbol']} - {data['signal_type']} - {data['strength']}")
+        self.logger.info("Sinal de estratégia: %s - %s - %s - %s", data['strategy_name'], data['symbol'], data['signal_type'], data['strength'])
         
         # Aqui você poderia:
         # - Avaliar se deve executar trade
@@ -93,18 +96,20 @@ class StrategyEventHandler(BaseEventHandler):
     async def _handle_strategy_started(self, event: IEvent) -> None:
         """Processa estratégia iniciada"""
         data = event.get_data()
-        self.logger.info(f"Estratégia iniciada: {data['strategy_name']} v{data['version']}")
+        self.logger.info("Estratégia iniciada: %s v%s", data['strategy_name'], data['version'])
     
     async def _handle_strategy_stopped(self, event: IEvent) -> None:
         """Processa estratégia parada"""
         data = event.get_data()
-        self.logger.info(f"Estratégia parada: {data['strategy_name']} - {data['reason']}")
+        self.logger.info("Estratégia parada: %s - %s", data['strategy_name'], data['reason'])
 
 class ErrorEventHandler(BaseEventHandler):
     """
     Handler para eventos de erro
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(['ErrorEvent'])
         self.logger = logging.getLogger(__name__)
@@ -112,7 +117,7 @@ class ErrorEventHandler(BaseEventHandler):
     async def _process_event(self, event: IEvent) -> None:
         """Processa eventos de erro"""
         data = event.get_data()
-        self.logger.error(f"Erro: {data['error_type']} - {data['error_message']}")
+        self.logger.error("Erro: %s - %s", data['error_type'], data['error_message'])
         
         # Aqui você poderia:
         # - Enviar alerta de erro
@@ -125,18 +130,21 @@ class SystemEventHandler(BaseEventHandler):
     Handler para eventos de sistema
     """
     
+    __slots__ = ('_dispatch_map',)
+    
     def __init__(self):
         super().__init__(['SystemEvent', 'PerformanceEvent'])
         self.logger = logging.getLogger(__name__)
+        self._dispatch_map = {
+            'SystemEvent': self._handle_system_event,
+            'PerformanceEvent': self._handle_performance_event
+        }
     
     async def _process_event(self, event: IEvent) -> None:
         """Processa eventos de sistema"""
-        event_type = event.get_event_type()
-        
-        if event_type == 'SystemEvent':
-            await self._handle_system_event(event)
-        elif event_type == 'PerformanceEvent':
-            await self._handle_performance_event(event)
+        handler = self._dispatch_map.get(event.get_event_type())
+        if handler is not None:
+            await handler(event)
     
     async def _handle_system_event(self, event: IEvent) -> None:
         """Processa evento de sistema"""
@@ -144,18 +152,18 @@ class SystemEventHandler(BaseEventHandler):
         severity = data.get('severity', 'info')
         
         if severity == 'critical':
-            self.logger.critical(f"Sistema: {data['message']}")
+            self.logger.critical("Sistema: %s", data['message'])
         elif severity == 'error':
-            self.logger.error(f"Sistema: {data['message']}")
+            self.logger.error("Sistema: %s", data['message'])
         elif severity == 'warning':
-            self.logger.warning(f"Sistema: {data['message']}")
+            self.logger.warning("Sistema: %s", data['message'])
         else:
-            self.logger.info(f"Sistema: {data['message']}")
+            self.logger.info("Sistema: %s", data['message'])
     
     async def _handle_performance_event(self, event: IEvent) -> None:
         """Processa evento de performance"""
         data = event.get_data()
-        self.logger.info(f"Performance: {data['metric_name']} = {data['metric_value']} {data['metric_unit']}")
+        self.logger.info("Performance: %s = %s %s", data['metric_name'], data['metric_value'], data['metric_unit'])
         
         # Aqui você poderia:
         # - Atualizar métricas de performance
@@ -168,6 +176,8 @@ class NotificationEventHandler(BaseEventHandler):
     Handler para eventos de notificação
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(['NotificationEvent'])
         self.logger = logging.getLogger(__name__)
@@ -181,21 +191,23 @@ class NotificationEventHandler(BaseEventHandler):
         priority = data.get('priority', 'normal')
         
         if channel == 'console':
-            self.logger.info(f"Notificação: {data['title']} - {data['message']}")
+            self.logger.info("Notificação: %s - %s", data['title'], data['message'])
         elif channel == 'telegram':
             # Aqui você implementaria envio para Telegram
-            self.logger.info(f"Telegram: {data['title']} - {data['message']}")
+            self.logger.info("Telegram: %s - %s", data['title'], data['message'])
         elif channel == 'email':
             # Aqui você implementaria envio por email
-            self.logger.info(f"Email: {data['title']} - {data['message']}")
+            self.logger.info("Email: %s - %s", data['title'], data['message'])
         else:
-            self.logger.info(f"Notificação ({channel}): {data['title']} - {data['message']}")
+            self.logger.info("Notificação (%s): %s - %s", channel, data['title'], data['message'])
 
 class AuditEventHandler(BaseEventHandler):
     """
     Handler para eventos de auditoria
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(['AuditEvent'])
         self.logger = logging.getLogger(__name__)
@@ -205,7 +217,7 @@ class AuditEventHandler(BaseEventHandler):
         data = event.get_data()
         
         # Simula registro de auditoria
-        self.logger.info(f"Auditoria: {data['action']} - {data['resource']} - {data['resource_id']}")
+        self.logger.info("Auditoria: %s - %s - %s", data['action'], data['resource'], data['resource_id'])
         
         # Aqui você poderia:
         # - Registrar em banco de dados de auditoria
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+📡 ORDER EVENTS NEØ - EVENTOS DE ORDEM
+Eventos do ciclo de vida de ordens
+"""
+
+from typing import Optional
+from dataclasses import dataclass, field
+
+from .base_event import BaseEvent
+
+# =============================================================================
+# EVENTOS DE ORDEM
+# =============================================================================
+
+@dataclass(slots=True)
+class OrderCreatedEvent(BaseEvent):
+    """Evento de ordem criada"""
+    order_id: str
+    symbol: str
+    side: str
+    order_type: str
+    quantity: float
+    price: Optional[float] = field(default=None)
+    position_side: str = field(default="LONG")
+    leverage: int = field(default=1)
+    strategy_id: Optional[str] = field(default=None)
+
+@dataclass(slots=True)
+class OrderFilledEvent(BaseEvent):
+    """Evento de ordem executada"""
+    order_id: str
+    symbol: str
+    filled_quantity: float
+    filled_price: float
+    remaining_quantity: float = field(default=0)
+    commission: Optional[float] = field(default=None)
+
+@dataclass(slots=True)
+class OrderCancelledEvent(BaseEvent):
+    """Evento de ordem cancelada"""
+    order_id: str
+    symbol: str
+    reason: str
+    cancelled_quantity: float
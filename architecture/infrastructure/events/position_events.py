@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+📡 POSITION EVENTS NEØ - EVENTOS DE POSIÇÃO
+Eventos de abertura e fechamento de posições
+"""
+
+from dataclasses import dataclass
+
+from .base_event import BaseEvent
+
+# =============================================================================
+# EVENTOS DE POSIÇÃO
+# =============================================================================
+
+@dataclass(slots=True)
+class PositionOpenedEvent(BaseEvent):
+    """Evento de posição aberta"""
+    position_id: str
+    symbol: str
+    side: str  # "LONG" ou "SHORT"
+    size: float
+    entry_price: float
+    leverage: int
+    margin: float
+
+@dataclass(slots=True)
+class PositionClosedEvent(BaseEvent):
+    """Evento de posição fechada"""
+    position_id: str
+    symbol: str
+    side: str
+    size: float
+    entry_price: float
+    exit_price: float
+    pnl: float
+    pnl_percentage: float
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+📡 STRATEGY EVENTS NEØ - EVENTOS DE ESTRATÉGIA
+Eventos emitidos por estratégias
+"""
+
+from typing import Optional
+from dataclasses import dataclass, field
+
+from .base_event import BaseEvent
+
+# =============================================================================
+# EVENTOS DE ESTRATÉGIA
+# =============================================================================
+
+@dataclass(slots=True)
+class StrategySignalEvent(BaseEvent):
+    """Evento de sinal de estratégia"""
+    strategy_id: str
+    strategy_name: str
+    symbol: str
+    signal_type: str  # "LONG", "SHORT", "NEUTRAL"
+    strength: float
+    confidence: float
+    reasoning: str
+    entry_price: Optional[float] = field(default=None)
+    stop_loss: Optional[float] = field(default=None)
+    take_profit: Optional[float] = field(default=None)
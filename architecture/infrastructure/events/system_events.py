@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+📡 SYSTEM EVENTS NEØ - EVENTOS DE SISTEMA
+Eventos de erro, sistema, performance e notificação
+"""
+
+from typing import Dict, Optional, Any
+from dataclasses import dataclass, field
+
+from .base_event import BaseEvent
+
+# =============================================================================
+# EVENTOS DE SISTEMA
+# =============================================================================
+
+@dataclass(slots=True)
+class ErrorEvent(BaseEvent):
+    """Evento de erro"""
+    error_type: str
+    error_message: str
+    error_code: Optional[str] = field(default=None)
+    stack_trace: Optional[str] = field(default=None)
+    context: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass(slots=True)
+class SystemEvent(BaseEvent):
+    """Evento de sistema"""
+    event_category: str  # "startup", "shutdown", "maintenance", "alert"
+    message: str
+    severity: str = field(default="info")  # "info", "warning", "error", "critical"
+    details: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass(slots=True)
+class PerformanceEvent(BaseEvent):
+    """Evento de performance"""
+    metric_name: str
+    metric_value: float
+    metric_unit: str
+    threshold: Optional[float] = field(default=None)
+    is_alert: bool = field(default=False)
+
+@dataclass(slots=True)
+class NotificationEvent(BaseEvent):
+    """Evento de notificação"""
+    notification_type: str  # "trade", "alert", "info", "warning", "error"
+    title: str
+    message: str
+    channel: str = field(default="default")  # "telegram", "email", "webhook", "console"
+    priority: str = field(default="normal")  # "low", "normal", "high", "urgent"
+    data: Dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+📡 TRADE EVENTS NEØ - EVENTOS DE TRADE
+Eventos de execução de trades
+"""
+
+from typing import Optional
+from dataclasses import dataclass, field
+
+from .base_event import BaseEvent
+
+# =============================================================================
+# EVENTOS DE TRADING
+# =============================================================================
+
+@dataclass(slots=True)
+class TradeExecutedEvent(BaseEvent):
+    """Evento de trade executado"""
+    symbol: str
+    side: str  # "BUY" ou "SELL"
+    quantity: float
+    price: float
+    position_side: str  # "LONG" ou "SHORT"
+    leverage: int
+    strategy_id: Optional[str] = field(default=None)
+    order_id: Optional[str] = field(default=None)
+    pnl: Optional[float] = field(default=None)
@@ -4,6 +4,7 @@
 Implementação específica para repositório de ativos
 """
 
+from collections import Counter
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
@@ -17,17 +18,13 @@ class AssetRepository(BaseRepository[Asset], IAssetRepository):
     """
     
     def __init__(self, data_file: str = "data/assets.json"):
-        super().__init__(data_file, Asset)
+        super().__init__(data_file, Asset, index_specs={
+            'symbol': lambda asset: asset.symbol_upper,
+        })
     
     async def get_by_symbol(self, symbol: str) -> Optional[Asset]:
         """Obtém ativo por símbolo"""
-        assets = await self.get_all()
-        
-        for asset in assets:
-            if asset.symbol.upper() == symbol.upper():
-                return asset
-        
-        return None
+        return await self.get_first_by_index('symbol', symbol.upper())
     
     async def get_active_assets(self) -> List[Asset]:
         """Obtém ativos ativos"""
@@ -44,6 +41,11 @@ class AssetRepository(BaseRepository[Asset], IAssetRepository):
         assets = await self.get_all()
         filtered_assets = []
         
+        # Normaliza os critérios textuais uma vez, fora do laço
+        base_currency = criteria['base_currency'].upper() if 'base_currency' in criteria else None
+        quote_currency = criteria['quote_currency'].upper() if 'quote_currency' in criteria else None
+        pattern = criteria['symbol_pattern'].upper() if 'symbol_pattern' in criteria else None
+        
         for asset in assets:
             match = True
             
@@ -53,13 +55,13 @@ class AssetRepository(BaseRepository[Asset], IAssetRepository):
                     match = False
             
             # Filtra por base currency
-            if 'base_currency' in criteria:
-                if asset.base_currency.upper() != criteria['base_currency'].upper():
+            if base_currency is not None:
+                if asset.base_currency.upper() != base_currency:
                     match = False
             
             # Filtra por quote currency
-            if 'quote_currency' in criteria:
-                if asset.quote_currency.upper() != criteria['quote_currency'].upper():
+            if quote_currency is not None:
+                if asset.quote_currency.upper() != quote_currency:
                     match = False
             
             # Filtra por contract type
@@ -78,9 +80,8 @@ class AssetRepository(BaseRepository[Asset], IAssetRepository):
                     match = False
             
             # Filtra por símbolo (partial match)
-            if 'symbol_pattern' in criteria:
-                pattern = criteria['symbol_pattern'].upper()
-                if pattern not in asset.symbol.upper():
+            if pattern is not None:
+                if pattern not in asset.symbol_upper:
                     match = False
             
             if match:
@@ -160,26 +161,20 @@ class AssetRepository(BaseRepository[Asset], IAssetRepository):
                 'currency_distribution': {}
             }
         
-        active_count = len([a for a in assets if a.is_active()])
-        tradeable_count = len([a for a in assets if a.can_trade()])
+        active_count = sum(1 for a in assets if a.is_active())
+        tradeable_count = sum(1 for a in assets if a.can_trade())
         
         # Distribuição por status
-        status_dist = {}
-        for asset in assets:
-            status = asset.status.value
-            status_dist[status] = status_dist.get(status, 0) + 1
+        status_dist = Counter(asset.status.value for asset in assets)
         
         # Distribuição por moeda base
-        currency_dist = {}
-        for asset in assets:
-            currency = asset.base_currency
-            currency_dist[currency] = currency_dist.get(currency, 0) + 1
+        currency_dist = Counter(asset.base_currency for asset in assets)
         
         return {
             'total_assets': len(assets),
             'active_assets': active_count,
             'inactive_assets': len(assets) - active_count,
             'tradeable_assets': tradeable_count,
-            'status_distribution': status_dist,
-            'currency_distribution': currency_dist
+            'status_distribution': dict(status_dist),
+            'currency_distribution': dict(currency_dist)
         }
@@ -4,168 +4,629 @@
 Implementação base para todos os repositórios
 """
 
+import copy
 import json
+import time
 import asyncio
-from typing import Dict, List, Optional, Any, TypeVar, Generic
+import logging
+from dataclasses import fields, is_dataclass
+from operator import itemgetter, attrgetter
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Any, TypeVar, Generic, Callable, Hashable, Tuple, AsyncIterator, Iterable, Union, Collection
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 import aiofiles
 
+try:
+    import orjson
+except ImportError:  # acelerador opcional; json da stdlib como fallback
+    orjson = None
+
 from ...core.interfaces import IRepository
 from ...core.entities import Asset, Order, Trade, Position, Strategy
 
 T = TypeVar('T')
 
+def _json_default(obj: Any) -> Any:
+    """Serializa enums pelo valor (como o orjson) e o restante via str"""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+if orjson is not None:
+    _ORJSON_LINE_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    _ORJSON_OPTIONS = _ORJSON_LINE_OPTIONS | orjson.OPT_INDENT_2
+
+# Janela em que updated_at reaproveita o último timestamp formatado
+_NOW_ISO_TTL = 0.5
+_now_iso_cache: Tuple[str, float] = ('', 0.0)
+
+def _now_iso() -> str:
+    """Timestamp ISO atual, reaproveitado por até _NOW_ISO_TTL segundos em rajadas de save"""
+    global _now_iso_cache
+    now = time.time()
+    cached, cached_at = _now_iso_cache
+    if 0 <= now - cached_at < _NOW_ISO_TTL:
+        return cached
+    cached = datetime.fromtimestamp(now).isoformat()
+    _now_iso_cache = (cached, now)
+    return cached
+
+def _loads(content: Union[str, bytes]) -> Any:
+    """Decodifica JSON (orjson quando disponível); aceita bytes sem decodificar antes"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _dumps_line(obj: Any) -> str:
+    """Codifica JSON compacto em uma única linha (entrada do log)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_LINE_OPTIONS).decode()
+    return json.dumps(obj, default=_json_default)
+
+class _AsyncRWLock:
+    """Lock leitor/escritor para asyncio (escritores têm preferência)"""
+    
+    def __init__(self):
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+    
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[None]:
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self._writer and not self._writers_waiting)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+    
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[None]:
+        async with self._cond:
+            self._writers_waiting += 1
+            try:
+                await self._cond.wait_for(lambda: not self._writer and not self._readers)
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
 class BaseRepository(IRepository, Generic[T]):
     """
     Repositório base com implementação genérica
+    
+    Persistência: snapshot JSON (data_file) + log append-only de mutações
+    (data_file com sufixo .ndjson), compactado no snapshot quando cresce demais.
     """
     
-    def __init__(self, data_file: str, entity_class: type):
+    # Tamanho mínimo do log antes de considerar compactação
+    COMPACT_MIN_LOG_LINES = 256
+    # Máximo de resultados memorizados por _cached_query (LRU)
+    QUERY_CACHE_SIZE = 256
+    
+    def __init__(self, data_file: str, entity_class: type,
+                 index_specs: Optional[Dict[str, Callable[[T], Hashable]]] = None):
         self.data_file = Path(data_file)
         self.entity_class = entity_class
+        self._logger = logging.getLogger(__name__)
+        # Construtor posicional pré-compilado para registros com exatamente os campos da entidade
+        self._field_getter: Optional[Callable[[Dict[str, Any]], Tuple]] = None
+        self._field_count = 0
+        if is_dataclass(entity_class):
+            init_fields = [f for f in fields(entity_class) if f.init]
+            if init_fields and not any(f.kw_only for f in init_fields):
+                names = [f.name for f in init_fields]
+                getter = itemgetter(*names)
+                self._field_getter = getter if len(names) > 1 else (lambda data: (getter(data),))
+                self._field_count = len(names)
+        # Entidades em memória; populado uma única vez a partir do arquivo
         self._cache: Dict[str, T] = {}
-        self._lock = asyncio.Lock()
+        # Espelho serializável do arquivo (inclui registros que não convertem)
+        self._records: Dict[str, Dict] = {}
+        self._loaded = False
+        # Ids alterados desde a última gravação; o log recebe o estado final de cada um
+        self._pending_ids: Dict[str, None] = {}
+        self._log_file = self.data_file.with_suffix('.ndjson')
+        # Última saída de get_statistics gravada em disco, válida enquanto snapshot e log não mudarem
+        self._stats_file = self.data_file.with_suffix('.stats.json')
+        self._log_lines = 0
+        # Leituras em paralelo; mutações exclusivas. Arquivos têm lock próprio para
+        # que a gravação em disco não bloqueie consultas em memória.
+        self._lock = _AsyncRWLock()
+        self._io_lock = asyncio.Lock()
+        
+        # Índices secundários: nome -> chave -> ids (dict preserva a ordem de inserção)
+        self._index_specs: Dict[str, Callable[[T], Hashable]] = dict(index_specs or {})
+        self._indexes: Dict[str, Dict[Hashable, Dict[str, None]]] = {
+            name: {} for name in self._index_specs
+        }
+        # Chaves usadas ao indexar cada id, para remover mesmo após mutação da entidade
+        self._index_keys: Dict[str, Tuple[Hashable, ...]] = {}
+        # Resultados de consultas derivadas; descartados a cada mutação
+        self._query_cache: 'OrderedDict[Hashable, Tuple[T, ...]]' = OrderedDict()
+        # Último resultado de _cached_stats (None = recalcular)
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        # Entidades ordenadas por um campo datetime e suas chaves, para consultas
+        # por período via bisect (campo -> (chaves, entidades))
+        self._timelines: Dict[str, Tuple[List[datetime], List[T]]] = {}
     
     async def _load_data(self) -> Dict[str, Dict]:
         """Carrega dados do arquivo"""
         if not self.data_file.exists():
             return {}
         
-        async with aiofiles.open(self.data_file, 'r') as f:
+        # Leitura binária: o parser decodifica UTF-8 direto, sem str intermediária
+        async with aiofiles.open(self.data_file, 'rb') as f:
             content = await f.read()
             if content.strip():
-                return json.loads(content)
+                return _loads(content)
             return {}
     
     async def _save_data(self, data: Dict[str, Dict]) -> None:
         """Salva dados no arquivo"""
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
         
+        if orjson is not None:
+            # datetime/dataclass passam pelo mesmo default do json da stdlib
+            payload = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+            async with aiofiles.open(self.data_file, 'wb') as f:
+                await f.write(payload)
+            return
+        
         async with aiofiles.open(self.data_file, 'w') as f:
-            await f.write(json.dumps(data, indent=2, default=str))
+            await f.write(json.dumps(data, indent=2, default=_json_default))
+    
+    async def _replay_log(self, records: Dict[str, Dict]) -> Tuple[int, bool]:
+        """Reaplica o log sobre o snapshot; retorna (entradas, se havia linha danificada)"""
+        if not self._log_file.exists():
+            return 0, False
+        
+        async with aiofiles.open(self._log_file, 'rb') as f:
+            content = await f.read()
+        
+        entries = 0
+        damaged = False
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = _loads(line)
+            except ValueError as e:
+                # Linha truncada por uma escrita interrompida
+                self._logger.warning("Error reading log entry in %s: %s", self._log_file, e)
+                damaged = True
+                continue
+            entries += 1
+            if entry.get('op') == 'del':
+                records.pop(entry['id'], None)
+            else:
+                records[entry['id']] = entry['data']
+        return entries, damaged
+    
+    async def _append_log(self, lines: List[str]) -> None:
+        """Acrescenta entradas ao log"""
+        self._log_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        async with aiofiles.open(self._log_file, 'a') as f:
+            await f.write(''.join(line + '\n' for line in lines))
+    
+    async def _compact(self) -> None:
+        """Grava snapshot completo e trunca o log (chamar com _io_lock)"""
+        await self._save_data(self._records)
+        async with aiofiles.open(self._log_file, 'w') as f:
+            await f.write('')
+        self._log_lines = 0
     
     def _entity_to_dict(self, entity: T) -> Dict[str, Any]:
         """Converte entidade para dicionário"""
         if hasattr(entity, '__dict__'):
-            return entity.__dict__.copy()
+            # Atributos privados são caches derivados, não campos persistidos
+            return {k: v for k, v in entity.__dict__.items() if not k.startswith('_')}
         return {}
     
     def _dict_to_entity(self, data: Dict[str, Any]) -> T:
         """Converte dicionário para entidade"""
         try:
+            getter = self._field_getter
+            if getter is not None and len(data) == self._field_count:
+                try:
+                    return self.entity_class(*getter(data))
+                except KeyError:
+                    pass  # Chaves diferentes dos campos; **data reporta o erro
             return self.entity_class(**data)
         except Exception as e:
             raise ValueError(f"Error converting dict to {self.entity_class.__name__}: {e}")
     
-    async def get_by_id(self, id: str) -> Optional[T]:
-        """Obtém entidade por ID"""
-        async with self._lock:
-            # Verifica cache primeiro
-            if id in self._cache:
-                return self._cache[id]
+    async def _ensure_loaded(self) -> None:
+        """Carrega o arquivo para memória na primeira utilização (chamar com writer)"""
+        if self._loaded:
+            return
+        
+        async with self._io_lock:
+            self._records = await self._load_data()
+            self._log_lines, damaged = await self._replay_log(self._records)
+            if damaged:
+                # Reescreve sem a linha danificada para que novas entradas não colem nela
+                await self._compact()
+        self._cache = {}
+        self._clear_indexes()
+        for entity_id, entity_data in self._records.items():
+            try:
+                entity = self._dict_to_entity(entity_data)
+            except Exception as e:
+                self._logger.warning("Error loading entity: %s", e)
+                continue
+            self._cache[entity_id] = entity
+            self._index_entity(entity_id, entity)
+        self._loaded = True
+    
+    def _clear_indexes(self) -> None:
+        """Esvazia os índices secundários e as consultas memorizadas"""
+        for index in self._indexes.values():
+            index.clear()
+        self._index_keys.clear()
+        self._invalidate_derived()
+    
+    def _index_entity(self, entity_id: str, entity: T) -> None:
+        """Registra entidade nos índices secundários"""
+        if not self._index_specs:
+            return
+        keys = tuple(key_func(entity) for key_func in self._index_specs.values())
+        if self._index_keys.get(entity_id) == keys:
+            return
+        self._unindex_entity(entity_id)
+        for index, key in zip(self._indexes.values(), keys):
+            index.setdefault(key, {})[entity_id] = None
+        self._index_keys[entity_id] = keys
+    
+    def _unindex_entity(self, entity_id: str) -> None:
+        """Remove entidade dos índices secundários"""
+        keys = self._index_keys.pop(entity_id, None)
+        if keys is None:
+            return
+        for index, key in zip(self._indexes.values(), keys):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(entity_id, None)
+                if not bucket:
+                    del index[key]
+    
+    @asynccontextmanager
+    async def _reading(self) -> AsyncIterator[None]:
+        """Garante os dados carregados e mantém o lock de leitura"""
+        while True:
+            if not self._loaded:
+                async with self._lock.writer():
+                    await self._ensure_loaded()
+            async with self._lock.reader():
+                # clear_cache pode ter descartado a memória entre os dois locks
+                if self._loaded:
+                    yield
+                    return
+    
+    async def flush(self) -> None:
+        """
+        Grava no arquivo as alterações pendentes
+        
+        Commit em grupo: quem obtém o _io_lock grava tudo o que estiver pendente
+        numa única escrita; chamadas que esperavam na fila encontram suas
+        alterações já gravadas e retornam sem I/O.
+        """
+        async with self._io_lock:
+            if not self._pending_ids:
+                return
+            pending, self._pending_ids = self._pending_ids, {}
+            
+            records = self._records
+            lines = []
+            for entity_id in pending:
+                if entity_id in records:
+                    entry = {'op': 'put', 'id': entity_id, 'data': records[entity_id]}
+                else:
+                    entry = {'op': 'del', 'id': entity_id}
+                lines.append(_dumps_line(entry))
             
-            # Carrega do arquivo
-            data = await self._load_data()
-            if id in data:
-                entity = self._dict_to_entity(data[id])
-                self._cache[id] = entity
-                return entity
+            try:
+                await self._append_log(lines)
+            except Exception:
+                # Mantém pendentes para a próxima tentativa
+                pending.update(self._pending_ids)
+                self._pending_ids = pending
+                raise
             
+            self._log_lines += len(lines)
+            if self._log_lines > max(2 * len(records), self.COMPACT_MIN_LOG_LINES):
+                await self._compact()
+    
+    def _invalidate_derived(self) -> None:
+        """
+        Descarta dados derivados das entidades (chamado a cada mutação e recarga)
+        
+        Subclasses que mantêm visões próprias sobre as entidades estendem este
+        método para descartá-las também.
+        """
+        self._query_cache.clear()
+        self._stats_cache = None
+        self._timelines.clear()
+    
+    def _get_timeline(self, field: str) -> Tuple[List[datetime], List[T]]:
+        """Entidades ordenadas pelo campo informado (chamar com lock de leitura)"""
+        timeline = self._timelines.get(field)
+        if timeline is None:
+            get_key = attrgetter(field)
+            entities = sorted(self._cache.values(), key=get_key)
+            timeline = ([get_key(entity) for entity in entities], entities)
+            self._timelines[field] = timeline
+        return timeline
+    
+    async def _slice_by_time(self, field: str, start: Optional[datetime], end: Optional[datetime],
+                             include_end: bool = True) -> List[T]:
+        """
+        Entidades com o campo datetime entre start e end, em ordem cronológica
+        
+        Os limites são comparados uma vez cada via bisect, em vez de comparar
+        cada entidade com o corte. Limites None ficam abertos.
+        """
+        async with self._reading():
+            return self._time_slice(field, start, end, include_end)
+    
+    def _time_slice(self, field: str, start: Optional[datetime], end: Optional[datetime],
+                    include_end: bool = True) -> List[T]:
+        """Versão síncrona de _slice_by_time (chamar com lock de leitura)"""
+        keys, entities = self._get_timeline(field)
+        lo = bisect_left(keys, start) if start is not None else 0
+        if end is None:
+            hi = len(keys)
+        else:
+            hi = (bisect_right if include_end else bisect_left)(keys, end)
+        return entities[lo:hi]
+    
+    async def _cached_stats(self, compute: Callable[[Collection[T]], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Estatísticas agregadas memorizadas até a próxima mutação (save/delete/reload)
+        
+        Painéis que consultam get_statistics periodicamente deixam de varrer
+        todas as entidades quando nada mudou. O resultado também é gravado em
+        disco, então um processo novo responde sem carregar o repositório
+        enquanto snapshot e log não mudarem. O chamador recebe uma cópia.
+        """
+        if not self._loaded:
+            # Processo recém-iniciado: evita carregar todas as entidades se os
+            # arquivos não mudaram desde o último cálculo gravado
+            persisted = await self._load_persisted_stats()
+            if persisted is not None:
+                return persisted
+        
+        fingerprint = None
+        async with self._reading():
+            stats = self._stats_cache
+            if stats is None:
+                stats = compute(self._cache.values())
+                self._stats_cache = stats
+                # Só grava se a memória estiver igual aos arquivos (nada pendente nem em gravação)
+                if not self._pending_ids and not self._io_lock.locked():
+                    fingerprint = self._files_fingerprint()
+            result = copy.deepcopy(stats)
+        
+        if fingerprint is not None:
+            await self._persist_stats(fingerprint, stats)
+        return result
+    
+    def _files_fingerprint(self) -> List[int]:
+        """Identifica a versão gravada dos dados (mtime e tamanho do snapshot e do log)"""
+        fingerprint = []
+        for path in (self.data_file, self._log_file):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                fingerprint += [0, 0]
+            else:
+                fingerprint += [stat.st_mtime_ns, stat.st_size]
+        return fingerprint
+    
+    async def _load_persisted_stats(self) -> Optional[Dict[str, Any]]:
+        """Estatísticas gravadas em disco, se ainda correspondem aos arquivos de dados"""
+        if not self._stats_file.exists():
+            return None
+        try:
+            async with aiofiles.open(self._stats_file, 'rb') as f:
+                persisted = _loads(await f.read())
+        except (OSError, ValueError) as e:
+            self._logger.warning("Error reading stats cache %s: %s", self._stats_file, e)
+            return None
+        if persisted.get('fingerprint') != self._files_fingerprint():
+            return None
+        return persisted.get('stats')
+    
+    async def _persist_stats(self, fingerprint: List[int], stats: Dict[str, Any]) -> None:
+        """Grava estatísticas junto da versão dos arquivos de onde vieram"""
+        try:
+            async with aiofiles.open(self._stats_file, 'w') as f:
+                await f.write(_dumps_line({'fingerprint': fingerprint, 'stats': stats}))
+        except OSError as e:
+            self._logger.warning("Error writing stats cache %s: %s", self._stats_file, e)
+    
+    async def _cached_query(self, key: Hashable, compute: Callable[[Iterable[T]], Iterable[T]]) -> List[T]:
+        """
+        Executa consulta derivada sobre as entidades, memorizando o resultado
+        
+        O resultado fica válido até a próxima mutação (save/delete/reload).
+        Entidades alteradas sem save() não invalidam o cache.
+        
+        Args:
+            key: Identifica a consulta e seus argumentos (precisa ser hashable)
+            compute: Recebe as entidades e devolve as que atendem à consulta
+        """
+        async with self._reading():
+            cache = self._query_cache
+            try:
+                result = cache.get(key)
+            except TypeError:
+                # Argumento não hashable: calcula sem memorizar
+                return list(compute(self._cache.values()))
+            if result is None:
+                result = tuple(compute(self._cache.values()))
+                cache[key] = result
+                if len(cache) > self.QUERY_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            return list(result)
+    
+    async def get_by_id(self, id: str) -> Optional[T]:
+        """Obtém entidade por ID"""
+        async with self._reading():
+            return self._cache.get(id)
+    
+    async def get_by_index(self, index_name: str, key: Hashable) -> List[T]:
+        """Obtém entidades com a chave informada no índice secundário"""
+        async with self._reading():
+            cache = self._cache
+            return [cache[entity_id] for entity_id in self._indexes[index_name].get(key, ())]
+    
+    async def get_first_by_index(self, index_name: str, key: Hashable) -> Optional[T]:
+        """Obtém a primeira entidade com a chave informada no índice secundário"""
+        async with self._reading():
+            for entity_id in self._indexes[index_name].get(key, ()):
+                return self._cache[entity_id]
             return None
     
+    async def get_grouped_by_index(self, index_name: str) -> Dict[Hashable, List[T]]:
+        """Obtém todas as entidades agrupadas pelas chaves do índice secundário"""
+        async with self._reading():
+            cache = self._cache
+            return {
+                key: [cache[entity_id] for entity_id in ids]
+                for key, ids in self._indexes[index_name].items()
+            }
+    
+    async def count_by_index(self, index_name: str, key: Hashable) -> int:
+        """Conta entidades com a chave informada no índice secundário (O(1))"""
+        async with self._reading():
+            return len(self._indexes[index_name].get(key, ()))
+    
+    async def count_where(self, predicate: Callable[[T], bool]) -> int:
+        """Conta entidades que atendem ao predicado sem montar lista intermediária"""
+        async with self._reading():
+            return sum(1 for entity in self._cache.values() if predicate(entity))
+    
     async def get_all(self) -> List[T]:
         """Obtém todas as entidades"""
-        async with self._lock:
-            data = await self._load_data()
-            entities = []
-            
-            for entity_data in data.values():
-                try:
-                    entity = self._dict_to_entity(entity_data)
-                    entities.append(entity)
-                except Exception as e:
-                    print(f"Error loading entity: {e}")
-                    continue
-            
-            return entities
+        async with self._reading():
+            return list(self._cache.values())
     
     async def save(self, entity: T) -> T:
         """Salva entidade"""
-        async with self._lock:
-            # Converte para dicionário
-            entity_dict = self._entity_to_dict(entity)
-            
-            # Carrega dados existentes
-            data = await self._load_data()
-            
-            # Atualiza timestamp
-            entity_dict['updated_at'] = datetime.now().isoformat()
-            
-            # Salva no dicionário
-            data[entity.id] = entity_dict
-            
-            # Salva no arquivo
-            await self._save_data(data)
+        async with self._lock.writer():
+            await self._ensure_loaded()
             
-            # Atualiza cache
-            self._cache[entity.id] = entity
-            
-            return entity
+            self._stage(entity)
+        
+        # Fora do lock de escrita: saves concorrentes compartilham a mesma gravação
+        await self.flush()
+        return entity
+    
+    async def update_many(self, ids: Iterable[str], mutate: Callable[[T], Any]) -> int:
+        """
+        Aplica mutate às entidades informadas e grava todas numa única escrita
+        
+        IDs inexistentes são ignorados.
+        
+        Args:
+            ids: IDs das entidades a alterar
+            mutate: Altera a entidade recebida in-place
+        
+        Returns:
+            Número de entidades alteradas
+        """
+        updated = 0
+        try:
+            async with self._lock.writer():
+                await self._ensure_loaded()
+                for entity_id in ids:
+                    entity = self._cache.get(entity_id)
+                    if entity is None:
+                        continue
+                    mutate(entity)
+                    self._stage(entity)
+                    updated += 1
+        finally:
+            # Mesmo se mutate falhar no meio, o que já foi alterado é gravado
+            if updated:
+                await self.flush()
+        return updated
+    
+    def _stage(self, entity: T) -> None:
+        """Atualiza memória e marca a entidade para gravação (chamar com writer)"""
+        # Converte para dicionário
+        entity_dict = self._entity_to_dict(entity)
+        
+        # Atualiza timestamp
+        entity_dict['updated_at'] = _now_iso()
+        
+        self._records[entity.id] = entity_dict
+        self._cache[entity.id] = entity
+        self._index_entity(entity.id, entity)
+        self._invalidate_derived()
+        self._pending_ids[entity.id] = None
     
     async def delete(self, id: str) -> bool:
         """Remove entidade por ID"""
-        async with self._lock:
-            # Carrega dados existentes
-            data = await self._load_data()
+        async with self._lock.writer():
+            await self._ensure_loaded()
             
-            if id in data:
-                # Remove do dicionário
-                del data[id]
-                
-                # Salva no arquivo
-                await self._save_data(data)
-                
-                # Remove do cache
-                if id in self._cache:
-                    del self._cache[id]
-                
-                return True
+            if id not in self._records:
+                return False
             
-            return False
+            del self._records[id]
+            self._cache.pop(id, None)
+            self._unindex_entity(id)
+            self._invalidate_derived()
+            self._pending_ids[id] = None
+        
+        await self.flush()
+        return True
     
     async def exists(self, id: str) -> bool:
         """Verifica se entidade existe"""
-        async with self._lock:
-            # Verifica cache primeiro
-            if id in self._cache:
-                return True
-            
-            # Verifica arquivo
-            data = await self._load_data()
-            return id in data
+        async with self._reading():
+            return id in self._records
     
     async def count(self) -> int:
         """Conta número de entidades"""
-        async with self._lock:
-            data = await self._load_data()
-            return len(data)
+        async with self._reading():
+            return len(self._records)
     
     async def clear_cache(self) -> None:
-        """Limpa cache"""
-        async with self._lock:
+        """Limpa cache (grava pendências antes de descartar a memória)"""
+        await self.flush()
+        async with self._lock.writer():
             self._cache.clear()
+            self._records.clear()
+            self._clear_indexes()
+            self._loaded = False
     
     async def reload_cache(self) -> None:
         """Recarrega cache do arquivo"""
-        async with self._lock:
-            self._cache.clear()
-            data = await self._load_data()
-            
-            for entity_data in data.values():
-                try:
-                    entity = self._dict_to_entity(entity_data)
-                    self._cache[entity.id] = entity
-                except Exception as e:
-                    print(f"Error loading entity to cache: {e}")
-                    continue
+        await self.flush()
+        async with self._lock.writer():
+            self._loaded = False
+            await self._ensure_loaded()
@@ -4,8 +4,8 @@
 Implementação específica para repositório de ordens
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Collection
+from datetime import datetime, timedelta
 
 from ...core.interfaces import IRepository
 from ...core.entities import Order, OrderStatus, OrderSide, PositionSide
@@ -17,17 +17,21 @@ class OrderRepository(BaseRepository[Order], IRepository):
     """
     
     def __init__(self, data_file: str = "data/orders.json"):
-        super().__init__(data_file, Order)
+        super().__init__(data_file, Order, index_specs={
+            'symbol': lambda order: order.symbol_upper,
+            'status': lambda order: order.status,
+            'side': lambda order: order.side,
+            'position_side': lambda order: order.position_side,
+            'external_id': lambda order: order.external_id,
+        })
     
     async def get_by_symbol(self, symbol: str) -> List[Order]:
         """Obtém ordens por símbolo"""
-        orders = await self.get_all()
-        return [order for order in orders if order.symbol.upper() == symbol.upper()]
+        return await self.get_by_index('symbol', symbol.upper())
     
     async def get_by_status(self, status: OrderStatus) -> List[Order]:
         """Obtém ordens por status"""
-        orders = await self.get_all()
-        return [order for order in orders if order.status == status]
+        return await self.get_by_index('status', status)
     
     async def get_pending_orders(self) -> List[Order]:
         """Obtém ordens pendentes"""
@@ -43,27 +47,20 @@ class OrderRepository(BaseRepository[Order], IRepository):
     
     async def get_by_side(self, side: OrderSide) -> List[Order]:
         """Obtém ordens por lado"""
-        orders = await self.get_all()
-        return [order for order in orders if order.side == side]
+        return await self.get_by_index('side', side)
     
     async def get_by_position_side(self, position_side: PositionSide) -> List[Order]:
         """Obtém ordens por lado da posição"""
-        orders = await self.get_all()
-        return [order for order in orders if order.position_side == position_side]
+        return await self.get_by_index('position_side', position_side)
     
     async def get_by_external_id(self, external_id: str) -> Optional[Order]:
         """Obtém ordem por ID externo"""
-        orders = await self.get_all()
-        for order in orders:
-            if order.external_id == external_id:
-                return order
-        return None
+        return await self.get_first_by_index('external_id', external_id)
     
     async def get_recent_orders(self, hours: int = 24) -> List[Order]:
         """Obtém ordens recentes"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        orders = await self.get_all()
-        return [order for order in orders if order.created_at >= cutoff_time]
+        return await self._slice_by_time('created_at', cutoff_time, None)
     
     async def get_orders_by_value_range(self, min_value: float = 0, max_value: float = float('inf')) -> List[Order]:
         """Obtém ordens por range de valor"""
@@ -99,8 +96,13 @@ class OrderRepository(BaseRepository[Order], IRepository):
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Obtém estatísticas das ordens"""
-        orders = await self.get_all()
-        
+        # Um único lock de leitura; o cálculo é síncrono e lê a memória direto
+        async with self._reading():
+            return self._compute_stats(self._cache.values())
+    
+    @staticmethod
+    def _compute_stats(orders: Collection[Order]) -> Dict[str, Any]:
+        """Calcula estatísticas (função pura, sem I/O nem lock)"""
         if not orders:
             return {
                 'total_orders': 0,
@@ -115,16 +117,35 @@ class OrderRepository(BaseRepository[Order], IRepository):
                 'total_value': 0
             }
         
-        pending_count = len(await self.get_pending_orders())
-        filled_count = len(await self.get_filled_orders())
-        cancelled_count = len(await self.get_cancelled_orders())
-        buy_count = len(await self.get_buy_orders())
-        sell_count = len(await self.get_sell_orders())
-        long_count = len(await self.get_long_orders())
-        short_count = len(await self.get_short_orders())
+        # Uma única passada sobre as ordens para todos os contadores
+        pending_count = filled_count = cancelled_count = 0
+        buy_count = sell_count = long_count = short_count = 0
+        total_value = 0
+        total_leverage = 0
         
-        total_value = sum(order.get_total_value().amount for order in orders)
-        avg_leverage = sum(order.leverage for order in orders) / len(orders)
+        for order in orders:
+            status = order.status
+            if status == OrderStatus.PENDING:
+                pending_count += 1
+            elif status == OrderStatus.FILLED:
+                filled_count += 1
+            elif status == OrderStatus.CANCELLED:
+                cancelled_count += 1
+            
+            side = order.side
+            if side == OrderSide.BUY:
+                buy_count += 1
+            elif side == OrderSide.SELL:
+                sell_count += 1
+            
+            position_side = order.position_side
+            if position_side == PositionSide.LONG:
+                long_count += 1
+            elif position_side == PositionSide.SHORT:
+                short_count += 1
+            
+            total_value += order.get_total_value().amount
+            total_leverage += order.leverage
         
         return {
             'total_orders': len(orders),
@@ -135,6 +156,6 @@ class OrderRepository(BaseRepository[Order], IRepository):
             'sell_orders': sell_count,
             'long_orders': long_count,
             'short_orders': short_count,
-            'avg_leverage': avg_leverage,
+            'avg_leverage': total_leverage / len(orders),
             'total_value': total_value
         }
@@ -4,30 +4,40 @@
 Implementação específica para repositório de posições
 """
 
-from typing import Dict, List, Optional, Any
+import heapq
+from typing import Dict, List, Optional, Any, Collection, Callable
 from datetime import datetime, timedelta
 
 from ...core.interfaces import IRepository
 from ...core.entities import Position, PositionSide
 from .base_repository import BaseRepository
 
+def _pnl_amount(position: Position) -> float:
+    """Chave de ordenação por PnL não realizado"""
+    return position.unrealized_pnl.amount
+
+def _is_losing(position: Position) -> bool:
+    """Posição sem lucro (complemento de is_profitable)"""
+    return not position.is_profitable()
+
 class PositionRepository(BaseRepository[Position], IRepository):
     """
     Repositório para entidades Position
     """
     
     def __init__(self, data_file: str = "data/positions.json"):
-        super().__init__(data_file, Position)
+        super().__init__(data_file, Position, index_specs={
+            'symbol': lambda pos: pos.symbol_upper,
+            'side': lambda pos: pos.side,
+        })
     
     async def get_by_symbol(self, symbol: str) -> List[Position]:
         """Obtém posições por símbolo"""
-        positions = await self.get_all()
-        return [pos for pos in positions if pos.symbol.upper() == symbol.upper()]
+        return await self.get_by_index('symbol', symbol.upper())
     
     async def get_by_side(self, side: PositionSide) -> List[Position]:
         """Obtém posições por lado"""
-        positions = await self.get_all()
-        return [pos for pos in positions if pos.side == side]
+        return await self.get_by_index('side', side)
     
     async def get_long_positions(self) -> List[Position]:
         """Obtém posições long"""
@@ -37,15 +47,40 @@ class PositionRepository(BaseRepository[Position], IRepository):
         """Obtém posições short"""
         return await self.get_by_side(PositionSide.SHORT)
     
+    async def _partition(self, predicates: Dict[str, Callable[[Position], bool]]) -> Dict[str, List[Position]]:
+        """
+        Separa as posições por vários critérios numa única passada
+        
+        Args:
+            predicates: Nome do grupo -> predicado; uma posição pode cair em vários grupos
+            
+        Returns:
+            Dict[str, List[Position]]: Posições de cada grupo, na ordem do repositório
+        """
+        groups = {name: [] for name in predicates}
+        checks = [(predicate, groups[name].append) for name, predicate in predicates.items()]
+        for pos in await self.get_all():
+            for predicate, append in checks:
+                if predicate(pos):
+                    append(pos)
+        return groups
+    
+    async def get_position_groups(self) -> Dict[str, List[Position]]:
+        """Obtém posições long, short, lucrativas e com prejuízo numa única passada"""
+        return await self._partition({
+            'long': Position.is_long,
+            'short': Position.is_short,
+            'profitable': Position.is_profitable,
+            'losing': _is_losing,
+        })
+    
     async def get_profitable_positions(self) -> List[Position]:
         """Obtém posições lucrativas"""
-        positions = await self.get_all()
-        return [pos for pos in positions if pos.is_profitable()]
+        return (await self._partition({'profitable': Position.is_profitable}))['profitable']
     
     async def get_losing_positions(self) -> List[Position]:
         """Obtém posições com prejuízo"""
-        positions = await self.get_all()
-        return [pos for pos in positions if not pos.is_profitable()]
+        return (await self._partition({'losing': _is_losing}))['losing']
     
     async def get_positions_by_leverage(self, min_leverage: int = 1, max_leverage: int = 100) -> List[Position]:
         """Obtém posições por range de leverage"""
@@ -66,8 +101,7 @@ class PositionRepository(BaseRepository[Position], IRepository):
     async def get_recent_positions(self, hours: int = 24) -> List[Position]:
         """Obtém posições recentes"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        positions = await self.get_all()
-        return [pos for pos in positions if pos.created_at >= cutoff_time]
+        return await self._slice_by_time('created_at', cutoff_time, None)
     
     async def get_positions_by_margin_range(self, min_margin: float = 0, max_margin: float = float('inf')) -> List[Position]:
         """Obtém posições por range de margem"""
@@ -79,20 +113,22 @@ class PositionRepository(BaseRepository[Position], IRepository):
     
     async def get_top_positions_by_pnl(self, limit: int = 10) -> List[Position]:
         """Obtém top posições por PnL"""
-        positions = await self.get_all()
-        positions.sort(key=lambda p: p.unrealized_pnl.amount, reverse=True)
-        return positions[:limit]
+        # O(N log limit) em vez de ordenar tudo; mesma ordem de sorted() para empates
+        return heapq.nlargest(limit, await self.get_all(), key=_pnl_amount)
     
     async def get_worst_positions_by_pnl(self, limit: int = 10) -> List[Position]:
         """Obtém piores posições por PnL"""
-        positions = await self.get_all()
-        positions.sort(key=lambda p: p.unrealized_pnl.amount)
-        return positions[:limit]
+        return heapq.nsmallest(limit, await self.get_all(), key=_pnl_amount)
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Obtém estatísticas das posições"""
-        positions = await self.get_all()
-        
+        # Um único lock de leitura; o cálculo é síncrono e lê a memória direto
+        async with self._reading():
+            return self._compute_stats(self._cache.values())
+    
+    @staticmethod
+    def _compute_stats(positions: Collection[Position]) -> Dict[str, Any]:
+        """Calcula estatísticas (função pura, sem I/O nem lock)"""
         if not positions:
             return {
                 'total_positions': 0,
@@ -108,29 +144,24 @@ class PositionRepository(BaseRepository[Position], IRepository):
                 'total_margin': 0
             }
         
-        long_count = len(await self.get_long_positions())
-        short_count = len(await self.get_short_positions())
-        profitable_count = len(await self.get_profitable_positions())
-        losing_count = len(await self.get_losing_positions())
-        
-        total_pnl = sum(pos.unrealized_pnl.amount for pos in positions)
-        avg_pnl = total_pnl / len(positions)
-        max_pnl = max(pos.unrealized_pnl.amount for pos in positions)
-        min_pnl = min(pos.unrealized_pnl.amount for pos in positions)
-        
-        avg_leverage = sum(pos.leverage for pos in positions) / len(positions)
-        total_margin = sum(pos.margin.amount for pos in positions)
+        # Colunas extraídas uma vez; somas, máximos e mínimos rodam em C (builtins)
+        pnls = [pos.unrealized_pnl.amount for pos in positions]
+        sides = [pos.side for pos in positions]
+        profitable_count = sum(map(Position.is_profitable, positions))
+        total_pnl = sum(pnls)
+        total_leverage = sum([pos.leverage for pos in positions])
+        total_margin = sum([pos.margin.amount for pos in positions])
         
         return {
             'total_positions': len(positions),
-            'long_positions': long_count,
-            'short_positions': short_count,
+            'long_positions': sides.count(PositionSide.LONG),
+            'short_positions': sides.count(PositionSide.SHORT),
             'profitable_positions': profitable_count,
-            'losing_positions': losing_count,
+            'losing_positions': len(positions) - profitable_count,
             'total_pnl': total_pnl,
-            'avg_pnl': avg_pnl,
-            'max_pnl': max_pnl,
-            'min_pnl': min_pnl,
-            'avg_leverage': avg_leverage,
+            'avg_pnl': total_pnl / len(positions),
+            'max_pnl': max(pnls),
+            'min_pnl': min(pnls),
+            'avg_leverage': total_leverage / len(positions),
             'total_margin': total_margin
         }
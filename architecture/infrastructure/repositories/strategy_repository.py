@@ -4,7 +4,7 @@
 Implementação específica para repositório de estratégias
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Collection, Iterable
 from datetime import datetime, timedelta
 
 from ...core.interfaces import IRepository
@@ -17,20 +17,28 @@ class StrategyRepository(BaseRepository[Strategy], IRepository):
     """
     
     def __init__(self, data_file: str = "data/strategies.json"):
-        super().__init__(data_file, Strategy)
+        super().__init__(data_file, Strategy, index_specs={
+            'name': lambda strategy: strategy.name.lower(),
+            'strategy_type': lambda strategy: strategy.strategy_type,
+            'version': lambda strategy: strategy.version,
+        })
     
     async def get_by_name(self, name: str) -> Optional[Strategy]:
         """Obtém estratégia por nome"""
-        strategies = await self.get_all()
-        for strategy in strategies:
-            if strategy.name.lower() == name.lower():
-                return strategy
-        return None
+        return await self.get_first_by_index('name', name.lower())
     
     async def get_by_type(self, strategy_type: StrategyType) -> List[Strategy]:
         """Obtém estratégias por tipo"""
-        strategies = await self.get_all()
-        return [strategy for strategy in strategies if strategy.strategy_type == strategy_type]
+        return await self.get_by_index('strategy_type', strategy_type)
+    
+    async def get_all_by_type_grouped(self) -> Dict[StrategyType, List[Strategy]]:
+        """
+        Obtém estratégias agrupadas por tipo
+        
+        Para relatórios que precisam de vários tipos: uma única leitura do
+        índice em vez de uma chamada get_*_strategies por tipo.
+        """
+        return await self.get_grouped_by_index('strategy_type')
     
     async def get_active_strategies(self) -> List[Strategy]:
         """Obtém estratégias ativas"""
@@ -42,40 +50,52 @@ class StrategyRepository(BaseRepository[Strategy], IRepository):
         strategies = await self.get_all()
         return [strategy for strategy in strategies if not strategy.is_active]
     
+    async def count_active(self) -> int:
+        """Conta estratégias ativas"""
+        return await self.count_where(lambda strategy: strategy.is_active)
+    
+    async def count_inactive(self) -> int:
+        """Conta estratégias inativas"""
+        return await self.count_where(lambda strategy: not strategy.is_active)
+    
     async def get_strategies_by_version(self, version: str) -> List[Strategy]:
         """Obtém estratégias por versão"""
-        strategies = await self.get_all()
-        return [strategy for strategy in strategies if strategy.version == version]
+        return await self.get_by_index('version', version)
     
     async def get_recent_strategies(self, days: int = 7) -> List[Strategy]:
         """Obtém estratégias recentes"""
         cutoff_time = datetime.now() - timedelta(days=days)
-        strategies = await self.get_all()
-        return [strategy for strategy in strategies if strategy.created_at >= cutoff_time]
+        return await self._slice_by_time('created_at', cutoff_time, None)
     
     async def get_strategies_by_parameter(self, param_name: str, param_value: Any) -> List[Strategy]:
         """Obtém estratégias por parâmetro específico"""
-        strategies = await self.get_all()
-        return [
-            strategy for strategy in strategies 
-            if strategy.get_parameter(param_name) == param_value
-        ]
+        return await self._cached_query(
+            ('parameter', param_name, param_value),
+            lambda strategies: [
+                strategy for strategy in strategies
+                if strategy.get_parameter(param_name) == param_value
+            ]
+        )
     
     async def get_strategies_by_min_score(self, min_score: float) -> List[Strategy]:
         """Obtém estratégias com score mínimo"""
-        strategies = await self.get_all()
-        return [
-            strategy for strategy in strategies 
-            if strategy.get_parameter('min_score', 0) >= min_score
-        ]
+        return await self._cached_query(
+            ('min_score', min_score),
+            lambda strategies: [
+                strategy for strategy in strategies
+                if strategy.get_parameter('min_score', 0) >= min_score
+            ]
+        )
     
     async def get_strategies_by_max_leverage(self, max_leverage: int) -> List[Strategy]:
         """Obtém estratégias com leverage máximo"""
-        strategies = await self.get_all()
-        return [
-            strategy for strategy in strategies 
-            if strategy.get_parameter('max_leverage', 1) <= max_leverage
-        ]
+        return await self._cached_query(
+            ('max_leverage', max_leverage),
+            lambda strategies: [
+                strategy for strategy in strategies
+                if strategy.get_parameter('max_leverage', 1) <= max_leverage
+            ]
+        )
     
     async def get_sniper_strategies(self) -> List[Strategy]:
         """Obtém estratégias Sniper"""
@@ -99,30 +119,30 @@ class StrategyRepository(BaseRepository[Strategy], IRepository):
     
     async def activate_strategy(self, strategy_id: str) -> bool:
         """Ativa estratégia"""
-        strategy = await self.get_by_id(strategy_id)
-        if strategy:
-            strategy.activate()
-            await self.save(strategy)
-            return True
-        return False
+        return await self.activate_many((strategy_id,)) > 0
     
     async def deactivate_strategy(self, strategy_id: str) -> bool:
         """Desativa estratégia"""
-        strategy = await self.get_by_id(strategy_id)
-        if strategy:
-            strategy.deactivate()
-            await self.save(strategy)
-            return True
-        return False
+        return await self.deactivate_many((strategy_id,)) > 0
     
     async def update_strategy_parameters(self, strategy_id: str, new_parameters: Dict[str, Any]) -> bool:
         """Atualiza parâmetros da estratégia"""
-        strategy = await self.get_by_id(strategy_id)
-        if strategy:
-            strategy.update_parameters(new_parameters)
-            await self.save(strategy)
-            return True
-        return False
+        return await self.update_parameters_many({strategy_id: new_parameters}) > 0
+    
+    async def activate_many(self, strategy_ids: Iterable[str]) -> int:
+        """Ativa várias estratégias com uma única gravação; retorna quantas foram ativadas"""
+        return await self.update_many(strategy_ids, lambda strategy: strategy.activate())
+    
+    async def deactivate_many(self, strategy_ids: Iterable[str]) -> int:
+        """Desativa várias estratégias com uma única gravação; retorna quantas foram desativadas"""
+        return await self.update_many(strategy_ids, lambda strategy: strategy.deactivate())
+    
+    async def update_parameters_many(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """Atualiza parâmetros de várias estratégias (id -> parâmetros) com uma única gravação"""
+        return await self.update_many(
+            updates,
+            lambda strategy: strategy.update_parameters(updates[strategy.id])
+        )
     
     async def get_strategy_performance(self, strategy_id: str) -> Dict[str, Any]:
         """Obtém performance da estratégia"""
@@ -145,8 +165,15 @@ class StrategyRepository(BaseRepository[Strategy], IRepository):
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Obtém estatísticas das estratégias"""
-        strategies = await self.get_all()
+        return await self._cached_stats(self._compute_stats)
+    
+    def _compute_stats(self, strategies: Collection[Strategy]) -> Dict[str, Any]:
+        """
+        Calcula estatísticas das estratégias do repositório (chamar com lock de leitura)
         
+        As distribuições por tipo e versão saem dos buckets dos índices, com
+        StrategyType.value lido uma vez por tipo em vez de uma vez por estratégia.
+        """
         if not strategies:
             return {
                 'total_strategies': 0,
@@ -157,30 +184,25 @@ class StrategyRepository(BaseRepository[Strategy], IRepository):
                 'avg_success_rate': 0
             }
         
-        active_count = len(await self.get_active_strategies())
-        inactive_count = len(await self.get_inactive_strategies())
+        active_count = 0
+        total_success_rate = 0
         
-        # Distribuição por tipo
-        type_dist = {}
         for strategy in strategies:
-            strategy_type = strategy.strategy_type.value
-            type_dist[strategy_type] = type_dist.get(strategy_type, 0) + 1
-        
-        # Distribuição por versão
-        version_dist = {}
-        for strategy in strategies:
-            version = strategy.version
-            version_dist[version] = version_dist.get(version, 0) + 1
-        
-        # Taxa de sucesso média
-        success_rates = [strategy.get_success_rate() for strategy in strategies]
-        avg_success_rate = sum(success_rates) / len(success_rates) if success_rates else 0
+            if strategy.is_active:
+                active_count += 1
+            
+            total_success_rate += strategy.get_success_rate()
         
         return {
             'total_strategies': len(strategies),
             'active_strategies': active_count,
-            'inactive_strategies': inactive_count,
-            'type_distribution': type_dist,
-            'version_distribution': version_dist,
-            'avg_success_rate': avg_success_rate
+            'inactive_strategies': len(strategies) - active_count,
+            'type_distribution': {
+                strategy_type.value: len(ids)
+                for strategy_type, ids in self._indexes['strategy_type'].items()
+            },
+            'version_distribution': {
+                version: len(ids) for version, ids in self._indexes['version'].items()
+            },
+            'avg_success_rate': total_success_rate / len(strategies)
         }
@@ -4,7 +4,10 @@
 Implementação específica para repositório de trades
 """
 
-from typing import Dict, List, Optional, Any
+import heapq
+from collections import Counter
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Collection, Tuple, Callable
 from datetime import datetime, timedelta
 
 from ...core.interfaces import ITradeRepository
@@ -17,20 +20,56 @@ class TradeRepository(BaseRepository[Trade], ITradeRepository):
     """
     
     def __init__(self, data_file: str = "data/trades.json"):
-        super().__init__(data_file, Trade)
+        super().__init__(data_file, Trade, index_specs={
+            'symbol': lambda trade: trade.symbol_upper,
+            'side': lambda trade: trade.side,
+            'position_side': lambda trade: trade.position_side,
+            'strategy_id': lambda trade: trade.strategy_id,
+            'order_id': lambda trade: trade.order_id,
+            'day': lambda trade: trade.executed_at.date(),
+        })
+        # Visão colunar (refs, valor total, leverage) para filtros por faixa;
+        # montada sob demanda e descartada a cada mutação
+        self._columns: Optional[Tuple[Tuple[Trade, ...], List[float], List[int]]] = None
+        # get_total_value().amount por id, para não recriar Money a cada consulta
+        self._total_values: Optional[Dict[str, float]] = None
+    
+    def _invalidate_derived(self) -> None:
+        super()._invalidate_derived()
+        self._columns = None
+        self._total_values = None
+    
+    def _get_total_values(self) -> Dict[str, float]:
+        """Valor total de cada trade por id (chamar com lock de leitura)"""
+        total_values = self._total_values
+        if total_values is None:
+            total_values = {
+                trade_id: trade.get_total_value().amount
+                for trade_id, trade in self._cache.items()
+            }
+            self._total_values = total_values
+        return total_values
+    
+    def _get_columns(self) -> Tuple[Tuple[Trade, ...], List[float], List[int]]:
+        """Colunas paralelas dos trades (chamar com lock de leitura)"""
+        columns = self._columns
+        if columns is None:
+            trades = tuple(self._cache.values())
+            columns = (
+                trades,
+                list(self._get_total_values().values()),
+                [trade.leverage for trade in trades],
+            )
+            self._columns = columns
+        return columns
     
     async def get_by_symbol(self, symbol: str) -> List[Trade]:
         """Obtém trades por símbolo"""
-        trades = await self.get_all()
-        return [trade for trade in trades if trade.symbol.upper() == symbol.upper()]
+        return await self.get_by_index('symbol', symbol.upper())
     
     async def get_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Trade]:
         """Obtém trades por período"""
-        trades = await self.get_all()
-        return [
-            trade for trade in trades 
-            if start_date <= trade.executed_at <= end_date
-        ]
+        return await self._slice_by_time('executed_at', start_date, end_date)
     
     async def get_pending_trades(self) -> List[Trade]:
         """Obtém trades pendentes"""
@@ -40,40 +79,39 @@ class TradeRepository(BaseRepository[Trade], ITradeRepository):
     
     async def get_trades_by_side(self, side: OrderSide) -> List[Trade]:
         """Obtém trades por lado"""
-        trades = await self.get_all()
-        return [trade for trade in trades if trade.side == side]
+        return await self.get_by_index('side', side)
     
     async def get_trades_by_position_side(self, position_side: PositionSide) -> List[Trade]:
         """Obtém trades por lado da posição"""
-        trades = await self.get_all()
-        return [trade for trade in trades if trade.position_side == position_side]
+        return await self.get_by_index('position_side', position_side)
     
     async def get_trades_by_strategy(self, strategy_id: str) -> List[Trade]:
         """Obtém trades por estratégia"""
-        trades = await self.get_all()
-        return [trade for trade in trades if trade.strategy_id == strategy_id]
+        return await self.get_by_index('strategy_id', strategy_id)
     
     async def get_recent_trades(self, hours: int = 24) -> List[Trade]:
         """Obtém trades recentes"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        trades = await self.get_all()
-        return [trade for trade in trades if trade.executed_at >= cutoff_time]
+        return await self._slice_by_time('executed_at', cutoff_time, None)
     
     async def get_trades_by_leverage(self, min_leverage: int = 1, max_leverage: int = 100) -> List[Trade]:
         """Obtém trades por range de leverage"""
-        trades = await self.get_all()
-        return [
-            trade for trade in trades 
-            if min_leverage <= trade.leverage <= max_leverage
-        ]
+        return await self._cached_query(
+            ('leverage', min_leverage, max_leverage),
+            lambda _: self._filter_column(2, min_leverage, max_leverage)
+        )
     
     async def get_trades_by_value_range(self, min_value: float = 0, max_value: float = float('inf')) -> List[Trade]:
         """Obtém trades por range de valor"""
-        trades = await self.get_all()
-        return [
-            trade for trade in trades 
-            if min_value <= trade.get_total_value().amount <= max_value
-        ]
+        return await self._cached_query(
+            ('value', min_value, max_value),
+            lambda _: self._filter_column(1, min_value, max_value)
+        )
+    
+    def _filter_column(self, column: int, low: float, high: float) -> List[Trade]:
+        """Trades cujo valor na coluna está em [low, high] (chamar com lock de leitura)"""
+        columns = self._get_columns()
+        return [trade for trade, value in zip(columns[0], columns[column]) if low <= value <= high]
     
     async def get_long_trades(self) -> List[Trade]:
         """Obtém trades long"""
@@ -91,29 +129,98 @@ class TradeRepository(BaseRepository[Trade], ITradeRepository):
         """Obtém trades de venda"""
         return await self.get_trades_by_side(OrderSide.SELL)
     
+    async def count_long_trades(self) -> int:
+        """Conta trades long"""
+        return await self.count_by_index('position_side', PositionSide.LONG)
+    
+    async def count_short_trades(self) -> int:
+        """Conta trades short"""
+        return await self.count_by_index('position_side', PositionSide.SHORT)
+    
+    async def count_buy_trades(self) -> int:
+        """Conta trades de compra"""
+        return await self.count_by_index('side', OrderSide.BUY)
+    
+    async def count_sell_trades(self) -> int:
+        """Conta trades de venda"""
+        return await self.count_by_index('side', OrderSide.SELL)
+    
     async def get_trades_by_symbol_and_date(self, symbol: str, date: datetime) -> List[Trade]:
         """Obtém trades por símbolo e data específica"""
-        trades = await self.get_by_symbol(symbol)
-        return [
-            trade for trade in trades 
-            if trade.executed_at.date() == date.date()
-        ]
+        return await self.query(symbol=symbol, date=date)
+    
+    async def query(self, *, symbol: Optional[str] = None, date: Optional[datetime] = None,
+                    side: Optional[OrderSide] = None, position_side: Optional[PositionSide] = None,
+                    date_range: Optional[Tuple[datetime, datetime]] = None) -> List[Trade]:
+        """
+        Consulta trades combinando filtros numa única passada
+        
+        Parte do candidato mais seletivo (menor bucket de índice ou fatia do
+        período) e aplica os demais filtros sobre ele. Filtros None são ignorados.
+        """
+        async with self._reading():
+            # (tamanho, trades candidatos, filtro) por critério informado
+            sources = []
+            cache = self._cache
+            
+            def from_index(index_name: str, key: Any, predicate: Callable[[Trade], bool]) -> None:
+                ids = self._indexes[index_name].get(key, ())
+                sources.append((len(ids), lambda: [cache[trade_id] for trade_id in ids], predicate))
+            
+            if symbol is not None:
+                symbol_upper = symbol.upper()
+                from_index('symbol', symbol_upper, lambda trade: trade.symbol_upper == symbol_upper)
+            if date is not None:
+                day = date.date()
+                from_index('day', day, lambda trade: trade.executed_at.date() == day)
+            if side is not None:
+                from_index('side', side, lambda trade: trade.side == side)
+            if position_side is not None:
+                from_index('position_side', position_side, lambda trade: trade.position_side == position_side)
+            if date_range is not None:
+                start, end = date_range
+                in_range = self._time_slice('executed_at', start, end)
+                sources.append((len(in_range), lambda: in_range,
+                                lambda trade: start <= trade.executed_at <= end))
+            
+            if not sources:
+                return list(cache.values())
+            
+            sources.sort(key=lambda source: source[0])
+            candidates = sources[0][1]()
+            predicates = [source[2] for source in sources[1:]]
+            if not predicates:
+                return candidates
+            return [trade for trade in candidates if all(predicate(trade) for predicate in predicates)]
     
     async def get_top_trades_by_value(self, limit: int = 10) -> List[Trade]:
         """Obtém top trades por valor"""
-        trades = await self.get_all()
-        trades.sort(key=lambda t: t.get_total_value().amount, reverse=True)
-        return trades[:limit]
+        async with self._reading():
+            trades, values, _ = self._get_columns()
+            # Seleção parcial O(n log limit) sobre a coluna de valores, sem ordenar tudo
+            top = heapq.nlargest(limit, range(len(trades)), key=values.__getitem__)
+            return [trades[i] for i in top]
     
     async def get_trades_by_order_id(self, order_id: str) -> List[Trade]:
         """Obtém trades por ID da ordem"""
-        trades = await self.get_all()
-        return [trade for trade in trades if trade.order_id == order_id]
+        return await self.get_by_index('order_id', order_id)
+    
+    async def get_trade_by_order_id(self, order_id: str) -> Optional[Trade]:
+        """Obtém o primeiro trade da ordem (sem montar a lista completa)"""
+        return await self.get_first_by_index('order_id', order_id)
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Obtém estatísticas dos trades"""
-        trades = await self.get_all()
+        return await self._cached_stats(self._compute_stats)
+    
+    def _compute_stats(self, trades: Collection[Trade]) -> Dict[str, Any]:
+        """
+        Calcula estatísticas dos trades do repositório (chamar com lock de leitura)
         
+        Somas rodam em sum() sobre as colunas, contagens por lado e por
+        estratégia saem do tamanho dos buckets dos índices e a distribuição por
+        símbolo é contada pelo Counter.
+        """
         if not trades:
             return {
                 'total_trades': 0,
@@ -127,60 +234,35 @@ class TradeRepository(BaseRepository[Trade], ITradeRepository):
                 'strategy_distribution': {}
             }
         
-        total_value = sum(trade.get_total_value().amount for trade in trades)
-        long_count = len(await self.get_long_trades())
-        short_count = len(await self.get_short_trades())
-        buy_count = len(await self.get_buy_trades())
-        sell_count = len(await self.get_sell_trades())
-        avg_leverage = sum(trade.leverage for trade in trades) / len(trades)
-        
-        # Distribuição por símbolo
-        symbol_dist = {}
-        for trade in trades:
-            symbol = trade.symbol
-            symbol_dist[symbol] = symbol_dist.get(symbol, 0) + 1
-        
-        # Distribuição por estratégia
-        strategy_dist = {}
-        for trade in trades:
-            if trade.strategy_id:
-                strategy_dist[trade.strategy_id] = strategy_dist.get(trade.strategy_id, 0) + 1
-        
+        _, values, leverages = self._get_columns()
+        position_sides = self._indexes['position_side']
+        sides = self._indexes['side']
         return {
             'total_trades': len(trades),
-            'total_value': total_value,
-            'long_trades': long_count,
-            'short_trades': short_count,
-            'buy_trades': buy_count,
-            'sell_trades': sell_count,
-            'avg_leverage': avg_leverage,
-            'symbol_distribution': symbol_dist,
-            'strategy_distribution': strategy_dist
+            'total_value': sum(values),
+            'long_trades': len(position_sides.get(PositionSide.LONG, ())),
+            'short_trades': len(position_sides.get(PositionSide.SHORT, ())),
+            'buy_trades': len(sides.get(OrderSide.BUY, ())),
+            'sell_trades': len(sides.get(OrderSide.SELL, ())),
+            'avg_leverage': sum(leverages) / len(trades),
+            'symbol_distribution': dict(Counter(map(attrgetter('symbol'), trades))),
+            'strategy_distribution': {
+                strategy_id: len(ids)
+                for strategy_id, ids in self._indexes['strategy_id'].items()
+                if strategy_id
+            }
         }
     
     async def get_daily_statistics(self, date: datetime) -> Dict[str, Any]:
         """Obtém estatísticas diárias"""
-        trades = await self.get_trades_by_symbol_and_date("ALL", date)
-        
-        if not trades:
-            return {
-                'date': date.date().isoformat(),
-                'total_trades': 0,
-                'total_value': 0,
-                'long_trades': 0,
-                'short_trades': 0
-            }
-        
-        total_value = sum(trade.get_total_value().amount for trade in trades)
-        long_count = len([t for t in trades if t.is_long()])
-        short_count = len([t for t in trades if t.is_short()])
+        day = date.date()
+        async with self._reading():
+            cache = self._cache
+            summary = self._summarize([cache[trade_id] for trade_id in self._indexes['day'].get(day, ())])
         
         return {
-            'date': date.date().isoformat(),
-            'total_trades': len(trades),
-            'total_value': total_value,
-            'long_trades': long_count,
-            'short_trades': short_count
+            'date': day.isoformat(),
+            **summary
         }
     
     async def get_monthly_statistics(self, year: int, month: int) -> Dict[str, Any]:
@@ -191,25 +273,29 @@ class TradeRepository(BaseRepository[Trade], ITradeRepository):
         else:
             end_date = datetime(year, month + 1, 1)
         
-        trades = await self.get_by_date_range(start_date, end_date)
-        
-        if not trades:
-            return {
-                'year': year,
-                'month': month,
-                'total_trades': 0,
-                'total_value': 0,
-                'long_trades': 0,
-                'short_trades': 0
-            }
-        
-        total_value = sum(trade.get_total_value().amount for trade in trades)
-        long_count = len([t for t in trades if t.is_long()])
-        short_count = len([t for t in trades if t.is_short()])
+        async with self._reading():
+            summary = self._summarize(self._time_slice('executed_at', start_date, end_date, include_end=False))
         
         return {
             'year': year,
             'month': month,
+            **summary
+        }
+    
+    def _summarize(self, trades: Collection[Trade]) -> Dict[str, Any]:
+        """Totais de um período numa única passada (chamar com lock de leitura)"""
+        total_values = self._get_total_values()
+        total_value = 0
+        long_count = short_count = 0
+        for trade in trades:
+            total_value += total_values[trade.id]
+            position_side = trade.position_side
+            if position_side == PositionSide.LONG:
+                long_count += 1
+            elif position_side == PositionSide.SHORT:
+                short_count += 1
+        
+        return {
             'total_trades': len(trades),
             'total_value': total_value,
             'long_trades': long_count,
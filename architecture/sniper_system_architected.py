@@ -14,7 +14,7 @@ from .core.interfaces import *
 from .core.entities import *
 from .infrastructure.dependency_injection import DependencyContainer, get_container
 from .infrastructure.repositories import AssetRepository, TradeRepository
-from .domain.strategies import StrategyFactory, SniperStrategy
+from .domain.strategies import StrategyFactory, SniperStrategy, Direction
 from .infrastructure.events import EventBus, get_event_bus
 from .infrastructure.factories import CompositeServiceFactory
 
@@ -45,6 +45,7 @@ class SniperSystemArchitected:
         
         # Configurações
         self.threshold = 7.0
+        self.max_concurrent_analyses = 16
         self.assets = []
         
         print("🏗️ SNIPER SYSTEM ARCHITECTED NEØ INICIADO")
@@ -192,54 +193,15 @@ class SniperSystemArchitected:
             analysis_service = self.container.resolve(IAnalysisService)
             logger = self.container.resolve(ILogger)
             
-            results = []
-            
-            # Analisa cada ativo
-            for symbol in self.assets:
-                try:
-                    # Obtém dados de mercado
-                    price = await market_data_service.get_price(symbol)
-                    if not price:
-                        continue
-                    
-                    # Simula dados de análise
-                    analysis_data = {
-                        'symbol': symbol,
-                        'price': price,
-                        'rsi': 45.0,  # Simulado
-                        'macd_line': 0.001,  # Simulado
-                        'macd_signal': 0.0005,  # Simulado
-                        'volume': 1000000,  # Simulado
-                        'funding_rate': 0.001  # Simulado
-                    }
-                    
-                    # Analisa com estratégia
-                    signal = await self.strategy.analyze(analysis_data)
-                    
-                    if signal.direction != 'NEUTRAL' and signal.strength >= self.threshold:
-                        results.append({
-                            'symbol': symbol,
-                            'direction': signal.direction,
-                            'strength': signal.strength,
-                            'confidence': signal.confidence,
-                            'reasoning': signal.reasoning
-                        })
-                        
-                        # Publica evento de sinal
-                        from .infrastructure.events import StrategySignalEvent
-                        await self.event_bus.publish(StrategySignalEvent(
-                            strategy_id=self.strategy.id,
-                            strategy_name=self.strategy.get_name(),
-                            symbol=symbol,
-                            signal_type=signal.direction,
-                            strength=signal.strength,
-                            confidence=signal.confidence,
-                            reasoning=signal.reasoning
-                        ))
-                
-                except Exception as e:
-                    logger.error(f"Erro ao analisar {symbol}: {e}")
-                    continue
+            # Analisa os ativos em paralelo: as chamadas de mercado de cada símbolo
+            # se sobrepõem em vez de somar latências; o semáforo limita as
+            # requisições simultâneas para não estourar o rate limit
+            semaphore = asyncio.Semaphore(self.max_concurrent_analyses)
+            raw_results = await asyncio.gather(*(
+                self._analyze_symbol(symbol, market_data_service, logger, semaphore)
+                for symbol in self.assets
+            ), return_exceptions=True)
+            results = [result for result in raw_results if isinstance(result, dict)]
             
             # Ordena resultados
             results.sort(key=lambda x: x['strength'], reverse=True)
@@ -257,6 +219,65 @@ class SniperSystemArchitected:
             logger.error(f"Erro na análise arquitetada: {e}")
             return None
     
+    async def _analyze_symbol(self, symbol: str, market_data_service: IMarketDataService,
+                              logger: ILogger, semaphore: asyncio.Semaphore) -> Optional[Dict]:
+        """Analisa um ativo; retorna o resultado se houver sinal acima do threshold"""
+        result = None
+        try:
+            # Obtém dados de mercado
+            async with semaphore:
+                price = await market_data_service.get_price(symbol)
+            if not price:
+                return None
+            
+            # Simula dados de análise
+            analysis_data = {
+                'symbol': symbol,
+                'price': price,
+                'rsi': 45.0,  # Simulado
+                'macd_line': 0.001,  # Simulado
+                'macd_signal': 0.0005,  # Simulado
+                'volume': 1000000,  # Simulado
+                'funding_rate': 0.001  # Simulado
+            }
+            
+            # Analisa com estratégia
+            signal = await self.strategy.analyze(analysis_data)
+            
+            if signal.direction == Direction.NEUTRAL or signal.strength < self.threshold:
+                # Sinal descartado volta ao pool da estratégia
+                self.strategy.release_signal(signal)
+                return None
+            
+            # Resultado vale mesmo se a publicação do evento falhar
+            result = {
+                'symbol': symbol,
+                'direction': signal.direction_str,
+                'strength': signal.strength,
+                'confidence': signal.confidence,
+                'reasoning': str(signal.reasoning)
+            }
+            
+            # Publica evento de sinal
+            from .infrastructure.events import StrategySignalEvent
+            signal_event = StrategySignalEvent.acquire(
+                strategy_id=self.strategy.id,
+                strategy_name=self.strategy.get_name(),
+                symbol=symbol,
+                signal_type=signal.direction_str,
+                strength=signal.strength,
+                confidence=signal.confidence,
+                reasoning=str(signal.reasoning)
+            )
+            await self.event_bus.publish(signal_event)
+            # Handlers não guardam o evento; volta ao pool
+            signal_event.release()
+        
+        except Exception as e:
+            logger.error(f"Erro ao analisar {symbol}: {e}")
+        
+        return result
+    
     def _display_architected_results(self, results: List[Dict], processing_time: float):
         """Exibe resultados da análise arquitetada"""
         print(f"\n🏗️ ANÁLISE ARQUITETADA CONCLUÍDA EM {processing_time:.2f}s")
@@ -318,14 +339,16 @@ class SniperSystemArchitected:
             
             # Publica evento de criação de ordem
             from .infrastructure.events import OrderCreatedEvent
-            await self.event_bus.publish(OrderCreatedEvent(
+            order_event = OrderCreatedEvent.acquire(
                 order_id="temp_id",
                 symbol=trade_data['symbol'],
                 side=trade_data['side'],
                 order_type='Market',
                 quantity=trade_data['quantity'],
                 leverage=trade_data.get('leverage', 1)
-            ))
+            )
+            await self.event_bus.publish(order_event)
+            order_event.release()
             
             # Executa ordem (simulado)
             result = await trading_service.create_order(order_data)
@@ -333,14 +356,16 @@ class SniperSystemArchitected:
             if result:
                 # Publica evento de trade executado
                 from .infrastructure.events import TradeExecutedEvent
-                await self.event_bus.publish(TradeExecutedEvent(
+                trade_event = TradeExecutedEvent.acquire(
                     symbol=trade_data['symbol'],
                     side=trade_data['side'],
                     quantity=trade_data['quantity'],
                     price=trade_data.get('price', 0),
                     position_side=trade_data.get('position_side', 'LONG'),
                     leverage=trade_data.get('leverage', 1)
-                ))
+                )
+                await self.event_bus.publish(trade_event)
+                trade_event.release()
                 
                 return True
             
@@ -426,6 +451,12 @@ proporcionando um sistema robusto, flexível e fácil de manter.
         """Limpa recursos do sistema"""
         print("🧹 Limpando recursos da arquitetura...")
         
+        # Grava alterações pendentes dos repositórios
+        for repository in (self.asset_repository, self.trade_repository):
+            flush = getattr(repository, 'flush', None)
+            if flush is not None:
+                await flush()
+        
         # Limpa event bus
         self.event_bus.clear_handlers()
         
@@ -439,6 +470,11 @@ async def main():
     print("🏗️ TESTE DO SNIPER SYSTEM ARCHITECTED NEØ")
     print("=" * 70)
     
+    # Handlers que terminam sem await não passam pelo scheduler (3.12+)
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    
     sniper = SniperSystemArchitected()
     
     try: